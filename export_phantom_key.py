@@ -1,9 +1,14 @@
 import json
-import base58
+
+# Prefer the Rust-backed encoder when installed; same b58encode API as base58.
+try:
+    from based58 import b58encode
+except ImportError:
+    from base58 import b58encode
 
 # Load your Solana secret key (64 bytes) from the JSON file
 with open("jupiter_alt.json", "r", encoding="utf-8") as f:
     secret = bytes(json.load(f))
 
 # Print the base58-encoded secret key (what Phantom wants for "Import Private Key")
-print(base58.b58encode(secret).decode())
+print(b58encode(secret).decode())
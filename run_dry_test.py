@@ -40,24 +40,24 @@ from otq.engines.jupiter_dex_engine_v1_lite import main
 
 # Run engine with timeout
 async def run_with_timeout():
-    task = asyncio.create_task(main())
     try:
-        # Run for 95 seconds (3+ ticks with 30s interval)
-        await asyncio.wait_for(task, timeout=95.0)
-    except asyncio.TimeoutError:
+        # Run for 95 seconds (3+ ticks with 30s interval); the timeout
+        # cancels main() itself, so no wrapper task is needed
+        async with asyncio.timeout(95.0):
+            await main()
+    except TimeoutError:
         print("\n" + "="*60)
         print("DRY RUN TEST COMPLETED")
         print("="*60)
         print("✓ Engine ran successfully for 3+ ticks")
         print("✓ Check logs above for required outputs")
-        task.cancel()
     except KeyboardInterrupt:
         print("\n" + "="*60)
         print("Test stopped by user")
         print("="*60)
-        task.cancel()
 
 if __name__ == "__main__":
+    # Stdlib loop, as in run_engine.py, so the IPv4 getaddrinfo patch applies.
     try:
         asyncio.run(run_with_timeout())
     except KeyboardInterrupt:
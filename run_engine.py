@@ -29,7 +29,9 @@ def main() -> int:
     import asyncio
     from otq.engines.jupiter_dex_engine_v1_lite import main as engine_main
     
-    # Run the async engine
+    # Run the async engine on the stdlib loop. Not uvloop: its resolver
+    # (uv_getaddrinfo) bypasses the socket.getaddrinfo patch that
+    # bootstrap_network relies on to keep every client on IPv4.
     asyncio.run(engine_main())
     
     return 0
@@ -6,15 +6,37 @@ This is pull-based and throttled; best for backfill or low-frequency refresh.
 """
 
 import asyncio
+import heapq
 from datetime import datetime
 from decimal import Decimal
-from typing import List, AsyncIterator, Optional, Dict, Tuple
+from typing import List, AsyncIterator, Optional
 
 import httpx
+from cachetools import TTLCache
 from loguru import logger
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 from ...ports.market_data import MarketDataPort, Tick
 
+# Keep TLS connections to the provider warm between polls.
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=75)
+
+
+def _parse_av_ts(ts_str: str) -> datetime:
+    """Parse Alpha Vantage's fixed "YYYY-MM-DD HH:MM:SS" stamp without strptime."""
+    return datetime(
+        int(ts_str[0:4]),
+        int(ts_str[5:7]),
+        int(ts_str[8:10]),
+        int(ts_str[11:13]),
+        int(ts_str[14:16]),
+        int(ts_str[17:19]),
+    )
+
 
 class AlphaVantageAdapter(MarketDataPort):
     BASE_URL = "https://www.alphavantage.co/query"
@@ -26,10 +48,10 @@ class AlphaVantageAdapter(MarketDataPort):
         cache_ttl: int = 10,
     ):
         self.api_key = api_key
-        self._client = session or httpx.AsyncClient(timeout=10)
-        self._cache_ttl = cache_ttl
-        self._tick_cache: Dict[str, Tuple[datetime, Tick]] = {}
-        self._ohlcv_cache: Dict[str, Tuple[datetime, list]] = {}
+        self._client = session or httpx.AsyncClient(timeout=10, limits=_HTTP_LIMITS)
+        # Bounded TTL caches: expiry and eviction are handled by the cache itself.
+        self._tick_cache: TTLCache = TTLCache(maxsize=1024, ttl=cache_ttl)
+        self._ohlcv_cache: TTLCache = TTLCache(maxsize=256, ttl=cache_ttl)
 
     async def subscribe(self, symbols: List[str]) -> None:
         self._subscribed = symbols
@@ -49,7 +71,7 @@ class AlphaVantageAdapter(MarketDataPort):
 
     async def get_tick(self, symbol: str) -> Tick:
         # Derive tick from the most recent bar
-        bars = await self.get_ohlcv(symbol, "1min", limit=1)
+        bars = await self.get_ohlcv(symbol, "1m", limit=1)
         if not bars:
             raise RuntimeError(f"No intraday data for {symbol}")
         bar = bars[-1]
@@ -64,7 +86,7 @@ class AlphaVantageAdapter(MarketDataPort):
             ask=None,
             exchange="alphavantage",
         )
-        self._tick_cache[symbol] = (datetime.utcnow(), tick)
+        self._tick_cache[symbol] = tick
         return tick
 
     async def get_ohlcv(self, symbol: str, timeframe: str, limit: int = 200):
@@ -75,10 +97,10 @@ class AlphaVantageAdapter(MarketDataPort):
         if not timeframe.endswith("m"):
             raise ValueError("Alpha Vantage intraday adapter supports minute timeframes only")
 
-        cached = self._ohlcv_cache.get((symbol, timeframe))
-        now = datetime.utcnow()
-        if cached and (now - cached[0]).total_seconds() < self._cache_ttl:
-            return cached[1][-limit:]
+        cache_key = (symbol, timeframe, limit)
+        cached = self._ohlcv_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         params = {
             "function": "TIME_SERIES_INTRADAY",
@@ -89,10 +111,17 @@ class AlphaVantageAdapter(MarketDataPort):
             "apikey": self.api_key,
         }
         resp = await self._request(params)
-        series = resp.json().get("Time Series (1min)", {})
+        series = _json_loads(resp.content).get("Time Series (1min)", {})
+        # "full" output holds thousands of bars; only the newest `limit` are needed.
+        # Keys are ISO-style stamps, so string order is chronological.
+        if limit > 0:
+            items = heapq.nlargest(limit, series.items())
+            items.reverse()
+        else:
+            items = sorted(series.items())
         bars = []
-        for ts_str, row in sorted(series.items()):
-            ts = datetime.strptime(ts_str, "%Y-%m-%d %H:%M:%S")
+        for ts_str, row in items:
+            ts = _parse_av_ts(ts_str)
             bars.append(
                 {
                     "ts": ts,
@@ -103,8 +132,7 @@ class AlphaVantageAdapter(MarketDataPort):
                     "volume": Decimal(row["5. volume"]),
                 }
             )
-        bars = bars[-limit:]
-        self._ohlcv_cache[(symbol, timeframe)] = (now, bars)
+        self._ohlcv_cache[cache_key] = bars
         return bars
 
     async def get_perp_metrics(self, symbol: str):
@@ -1,16 +1,79 @@
 import asyncio
 import random
 import time
-from datetime import datetime, timedelta
+from datetime import datetime
 from decimal import Decimal
 from typing import List, AsyncIterator, Optional, Dict, Tuple
 
 import httpx
+from cachetools import TTLCache
 from loguru import logger
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 from ...ports.market_data import MarketDataPort, Tick
 from ...domain.models.perp_metrics import PerpMetrics
 
+# Keep TLS connections to the provider warm between polls.
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=75)
+
+# Minimal symbol->id map, keyed by upper-case symbol; extend via config if needed.
+_SYMBOL_MAP: Dict[str, str] = {
+    # Majors
+    "SOL": "solana",
+    "SOLUSD": "solana",
+    "SOLUSDT": "solana",
+    "BTC": "bitcoin",
+    "BTCUSD": "bitcoin",
+    "BTCUSDT": "bitcoin",
+    "ETH": "ethereum",
+    "ETHUSD": "ethereum",
+    "ETHUSDT": "ethereum",
+    # Meme/alt set
+    "BONK": "bonk",
+    "BONKUSDT": "bonk",
+    "BONKUSD": "bonk",
+    "TRUMP": "official-trump",
+    "TRUMPUSDT": "official-trump",
+    "TRUMPUSD": "official-trump",
+    "WIF": "dogwifcoin",
+    "WIFUSDT": "dogwifcoin",
+    "WIFUSD": "dogwifcoin",
+    "PEPE": "pepe",
+    "PEPEUSDT": "pepe",
+    "PEPEUSD": "pepe",
+    "DOGE": "dogecoin",
+    "DOGEUSDT": "dogecoin",
+    "DOGEUSD": "dogecoin",
+}
+
+
+class _TokenBucket:
+    """
+    Async token bucket: refills at `rate` tokens/second and banks up to `burst`.
+
+    Implemented as a lock-free slot scheduler (GCRA): each caller reserves its
+    start time against `_next_ts` synchronously, with no await in between, so
+    the event loop makes the reservation atomic. Callers then sleep until
+    their own slot and the HTTP calls overlap freely.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self._interval = 1.0 / rate
+        self._slack = self._interval * (max(1, burst) - 1)
+        self._next_ts = 0.0
+
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        due = max(self._next_ts, now)
+        self._next_ts = due + self._interval
+        delay = due - self._slack - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
 
 class CoinGeckoMarketDataAdapter(MarketDataPort):
     """
@@ -31,48 +94,24 @@ class CoinGeckoMarketDataAdapter(MarketDataPort):
         cache_ttl: int = 120,
         min_interval_seconds: float = 12.0,
         backoff_base_seconds: float = 5.0,
+        burst: int = 1,
     ):
         self.api_key = api_key
         self.quote_currency = quote_currency
-        self._client = session or httpx.AsyncClient(timeout=10)
-        self._cache_ttl = timedelta(seconds=cache_ttl)
-        self._price_cache: Dict[str, Tuple[datetime, Tick]] = {}
-        self._ohlcv_cache: Dict[str, Tuple[datetime, list]] = {}
-        self._perp_cache: Dict[str, Tuple[datetime, PerpMetrics]] = {}
+        self._client = session or httpx.AsyncClient(timeout=10, limits=_HTTP_LIMITS)
+        # Bounded TTL caches: expiry and eviction are handled by the cache itself.
+        # cache_ttl <= 0 turns the spot cache off, e.g. when a caller caches ticks itself.
+        self._price_cache: Optional[TTLCache] = TTLCache(maxsize=1024, ttl=cache_ttl) if cache_ttl > 0 else None
+        self._ohlcv_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+        self._perp_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+        self._derivatives_index: Optional[Tuple[float, Dict[str, dict]]] = None
+        self._derivatives_lock = asyncio.Lock()
         self._min_interval = max(0.5, float(min_interval_seconds))
         self._backoff_base = max(1.0, float(backoff_base_seconds))
-        self._rate_lock = asyncio.Lock()
-        self._last_request_ts = 0.0
-
-        # Minimal symbol->id map; extend via config if needed.
-        self.symbol_map = {
-            # Majors
-            "SOL": "solana",
-            "SOLUSD": "solana",
-            "SOLUSDT": "solana",
-            "BTC": "bitcoin",
-            "BTCUSD": "bitcoin",
-            "BTCUSDT": "bitcoin",
-            "ETH": "ethereum",
-            "ETHUSD": "ethereum",
-            "ETHUSDT": "ethereum",
-            # Meme/alt set
-            "BONK": "bonk",
-            "BONKUSDT": "bonk",
-            "BONKUSD": "bonk",
-            "TRUMP": "official-trump",
-            "TRUMPUSDT": "official-trump",
-            "TRUMPUSD": "official-trump",
-            "WIF": "dogwifcoin",
-            "WIFUSDT": "dogwifcoin",
-            "WIFUSD": "dogwifcoin",
-            "PEPE": "pepe",
-            "PEPEUSDT": "pepe",
-            "PEPEUSD": "pepe",
-            "DOGE": "dogecoin",
-            "DOGEUSDT": "dogecoin",
-            "DOGEUSD": "dogecoin",
-        }
+        self._bucket = _TokenBucket(rate=1.0 / self._min_interval, burst=burst)
+
+        # Per-instance copy so callers can extend it without touching the module map.
+        self.symbol_map = dict(_SYMBOL_MAP)
 
     async def subscribe(self, symbols: List[str]) -> None:
         # Pull-based adapter: no-op for subscribe.
@@ -93,16 +132,18 @@ class CoinGeckoMarketDataAdapter(MarketDataPort):
         await self._client.aclose()
 
     async def get_tick(self, symbol: str) -> Tick:
-        now = datetime.utcnow()
-        cached = self._price_cache.get(symbol)
-        if cached and now - cached[0] < self._cache_ttl:
-            return cached[1]
+        price_cache = self._price_cache
+        if price_cache is not None:
+            cached = price_cache.get(symbol)
+            if cached is not None:
+                return cached
 
+        now = datetime.utcnow()
         coin_id = self._resolve_id(symbol)
         params = {"ids": coin_id, "vs_currencies": self.quote_currency}
         headers = {"x-cg-demo-api-key": self.api_key} if self.api_key else None
         resp = await self._request("/simple/price", params=params, headers=headers)
-        data = resp.json()
+        data = _json_loads(resp.content)
         price = Decimal(str(data[coin_id][self.quote_currency]))
         tick = Tick(
             symbol=f"{symbol.upper()}{self.quote_currency.upper()}",
@@ -113,7 +154,8 @@ class CoinGeckoMarketDataAdapter(MarketDataPort):
             ask=None,
             exchange="coingecko",
         )
-        self._price_cache[symbol] = (now, tick)
+        if price_cache is not None:
+            price_cache[symbol] = tick
         return tick
 
     async def get_ohlcv(self, symbol: str, timeframe: str, limit: int = 200):
@@ -121,11 +163,10 @@ class CoinGeckoMarketDataAdapter(MarketDataPort):
         Fetch OHLC via CoinGecko's /ohlc endpoint (no volume provided; set to 0).
         Resolution is provider-defined (5m for 1 day, hourly for 7-30d, daily beyond).
         """
-        now = datetime.utcnow()
         cache_key = f"{symbol}:{timeframe}:{limit}"
         cached = self._ohlcv_cache.get(cache_key)
-        if cached and now - cached[0] < timedelta(minutes=5):
-            return cached[1]
+        if cached is not None:
+            return cached
 
         coin_id = self._resolve_id(symbol)
         days = self._timeframe_to_days(timeframe, limit)
@@ -134,10 +175,11 @@ class CoinGeckoMarketDataAdapter(MarketDataPort):
             "days": days,
         }
         resp = await self._request(f"/coins/{coin_id}/ohlc", params=params)
-        ohlc = resp.json()  # list of [timestamp, open, high, low, close]
+        ohlc = _json_loads(resp.content)  # list of [timestamp, open, high, low, close]
+        fromtimestamp = datetime.utcfromtimestamp  # hoisted: called once per bar
         bars = [
             {
-                "ts": datetime.utcfromtimestamp(row[0] / 1000),
+                "ts": fromtimestamp(row[0] / 1000),
                 "open": Decimal(str(row[1])),
                 "high": Decimal(str(row[2])),
                 "low": Decimal(str(row[3])),
@@ -146,20 +188,17 @@ class CoinGeckoMarketDataAdapter(MarketDataPort):
             }
             for row in ohlc[-limit:]
         ]
-        self._ohlcv_cache[cache_key] = (now, bars)
+        self._ohlcv_cache[cache_key] = bars
         return bars
 
     async def get_perp_metrics(self, symbol: str) -> Optional[PerpMetrics]:
-        now = datetime.utcnow()
         cached = self._perp_cache.get(symbol)
-        if cached and now - cached[0] < timedelta(minutes=1):
-            return cached[1]
+        if cached is not None:
+            return cached
 
-        params = {}
-        resp = await self._request("/derivatives", params=params)
-        records = resp.json()
         sym_upper = symbol.upper()
-        match = next((r for r in records if r.get("base") == sym_upper), None)
+        index = await self._get_derivatives_index()
+        match = index.get(sym_upper)
         if not match:
             return None
 
@@ -170,15 +209,35 @@ class CoinGeckoMarketDataAdapter(MarketDataPort):
             volume_24h=Decimal(str(match.get("trade_volume_24h_btc", 0))),
             timestamp=datetime.utcnow(),
         )
-        self._perp_cache[symbol] = (now, metrics)
+        self._perp_cache[symbol] = metrics
         return metrics
 
     # ------------------------------------------------------------------ #
     # Helpers                                                           #
     # ------------------------------------------------------------------ #
+    async def _get_derivatives_index(self) -> Dict[str, dict]:
+        """
+        /derivatives returns every contract on every exchange in one payload.
+        Index it by base symbol once per minute so per-symbol lookups are O(1).
+        """
+        async with self._derivatives_lock:
+            now = time.monotonic()
+            cached = self._derivatives_index
+            if cached and now - cached[0] < 60.0:
+                return cached[1]
+
+            resp = await self._request("/derivatives", params={})
+            index: Dict[str, dict] = {}
+            for record in _json_loads(resp.content):
+                base = record.get("base")
+                if base and base not in index:  # first listing wins, as before
+                    index[base] = record
+            self._derivatives_index = (now, index)
+            return index
+
     def _resolve_id(self, symbol: str) -> str:
-        key = symbol.upper()
-        coin_id = self.symbol_map.get(key)
+        # Callers usually pass upper-case symbols already; only normalize on a miss.
+        coin_id = self.symbol_map.get(symbol) or self.symbol_map.get(symbol.upper())
         if not coin_id:
             raise ValueError(f"Unknown CoinGecko id for symbol {symbol}")
         return coin_id
@@ -201,14 +260,9 @@ class CoinGeckoMarketDataAdapter(MarketDataPort):
     async def _request(self, path: str, params: dict, headers: Optional[dict] = None) -> httpx.Response:
         url = f"{self.BASE_URL}{path}"
         for attempt in range(2):
-            # Simple global rate limit: enforce spacing between requests
-            async with self._rate_lock:
-                now = time.monotonic()
-                delta = now - self._last_request_ts
-                if delta < self._min_interval:
-                    await asyncio.sleep(self._min_interval - delta)
-                resp = await self._client.get(url, params=params, headers=headers)
-                self._last_request_ts = time.monotonic()
+            # Global rate limit: one token per request, refilled every _min_interval
+            await self._bucket.acquire()
+            resp = await self._client.get(url, params=params, headers=headers)
             if resp.status_code == 429:
                 retry_after = resp.headers.get("Retry-After")
                 delay = float(retry_after) if retry_after else self._backoff_base * (2 ** attempt)
@@ -1,42 +1,50 @@
 import asyncio
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import List, AsyncIterator
+from typing import List, AsyncIterator, Tuple
 
 from ...ports.market_data import MarketDataPort, Tick
 
 
+# Five price levels 500.0, 500.5, ... 502.0 with a fixed 0.05 half-spread.
+_LEVELS = tuple(
+    (px, px - Decimal("0.05"), px + Decimal("0.05"))
+    for px in (Decimal("500") + Decimal(i) * Decimal("0.5") for i in range(5))
+)
+_ONE = Decimal("1")
+
+
 class MockMarketDataAdapter(MarketDataPort):
     """Simple in-memory tick generator for testing."""
 
     def __init__(self, symbols: List[str]):
         self.symbols = symbols
         self._running = False
-        self._ticks: List[Tick] = []
         now = datetime.utcnow()
-        for i in range(5):
-            for sym in symbols:
-                px = Decimal("500") + Decimal(i) * Decimal("0.5")
-                self._ticks.append(
-                    Tick(
-                        symbol=sym,
-                        timestamp=now + timedelta(seconds=i),
-                        price=px,
-                        size=Decimal("1"),
-                        bid=px - Decimal("0.05"),
-                        ask=px + Decimal("0.05"),
-                        exchange="MOCK",
-                    )
-                )
+        self._ticks: Tuple[Tick, ...] = tuple(
+            Tick(
+                symbol=sym,
+                timestamp=now + timedelta(seconds=i),
+                price=px,
+                size=_ONE,
+                bid=bid,
+                ask=ask,
+                exchange="MOCK",
+            )
+            for i, (px, bid, ask) in enumerate(_LEVELS)
+            for sym in symbols
+        )
 
     async def subscribe(self, symbols: List[str]) -> None:
         self.symbols = symbols
         self._running = True
 
-    async def stream(self) -> AsyncIterator[Tick]:
+    async def stream(self, pace: float = 0.01) -> AsyncIterator[Tick]:
+        """Replay the ticks; pass pace=0 for deterministic backtests."""
         for tick in self._ticks:
             yield tick
-            await asyncio.sleep(0.01)
+            if pace:
+                await asyncio.sleep(pace)
 
     async def get_snapshot(self, symbol: str) -> "MarketState":
         from ...domain.models.market_state import MarketState
@@ -1,31 +1,92 @@
-from typing import Dict
+from collections import deque
+from typing import Deque, Dict, Optional, TextIO, Tuple
+import atexit
+import sys
+import threading
 import time
 import uuid
 
 from ...ports.telemetry import TelemetryPort, TraceContext
 
+_BUFFER_SIZE = 65536
+_FLUSH_INTERVAL_S = 0.1
+
 
 class PrometheusAdapter(TelemetryPort):
-    """Minimal telemetry adapter (stdout-based placeholder)."""
+    """
+    Minimal telemetry adapter (stdout-based placeholder).
+
+    Records are appended to a bounded ring buffer and written in batches by a
+    background thread, so the hot path never formats or issues a write. When
+    the buffer is full the oldest records are dropped. Tags and context are
+    copied when recorded and formatted at flush time.
+    """
 
-    def __init__(self, port: int = 8000):
+    def __init__(self, port: int = 8000, stream: Optional[TextIO] = None):
         self.port = port
+        self._stream = stream
+        self._buf: Deque[Tuple[str, tuple]] = deque(maxlen=_BUFFER_SIZE)
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._flusher_lock = threading.Lock()
 
     def start(self):
         # Placeholder: no server started to keep dependencies light.
-        pass
+        self._start_flusher()
+
+    def stop(self) -> None:
+        """Stop the flusher thread and write out anything still buffered."""
+        self._stop.set()
+        with self._flusher_lock:
+            if self._flusher is not None:
+                self._flusher.join()
+                self._flusher = None
+                atexit.unregister(self.flush)
+        self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered records in a single write call."""
+        buf = self._buf
+        lines = []
+        while True:
+            try:
+                fmt, args = buf.popleft()
+            except IndexError:
+                break
+            lines.append(fmt.format(*args))
+        if lines:
+            stream = self._stream or sys.stdout
+            stream.write("\n".join(lines) + "\n")
+            stream.flush()
 
     def record_metric(self, name: str, value: float, tags: Dict[str, str]) -> None:
-        print(f"[metric] {name}={value} tags={tags}")
+        self._emit("[metric] {}={} tags={}", (name, value, dict(tags) if tags else {}))
 
     def record_latency(self, operation: str, duration_ms: float) -> None:
-        print(f"[latency] {operation} {duration_ms:.2f}ms")
+        self._emit("[latency] {} {:.2f}ms", (operation, duration_ms))
 
     def log_structured(self, level: str, message: str, context: Dict) -> None:
-        print(f"[{level}] {message} | {context}")
+        self._emit("[{}] {} | {}", (level, message, dict(context) if context else {}))
 
     def start_trace(self, operation: str) -> TraceContext:
         return TraceContext(
             trace_id=str(uuid.uuid4()), span_id=str(uuid.uuid4())[:8], operation=operation, start_time=time.time()
         )
 
+    def _emit(self, fmt: str, args: tuple) -> None:
+        self._buf.append((fmt, args))
+        if self._flusher is None:
+            self._start_flusher()
+
+    def _start_flusher(self) -> None:
+        with self._flusher_lock:
+            if self._flusher is not None:
+                return
+            self._stop.clear()
+            self._flusher = threading.Thread(target=self._run_flusher, name="telemetry-flush", daemon=True)
+            self._flusher.start()
+            atexit.register(self.flush)
+
+    def _run_flusher(self) -> None:
+        while not self._stop.wait(_FLUSH_INTERVAL_S):
+            self.flush()
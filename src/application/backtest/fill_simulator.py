@@ -4,6 +4,13 @@ from decimal import Decimal
 from typing import Optional
 import numpy as np
 
+from ...domain.models.order import OrderType, Side
+
+# Market-order fill delays are drawn in blocks to amortize the per-call RNG overhead.
+_FILL_TIME_BATCH = 4096
+_ZERO = Decimal(0)
+_ADVERSE_IMPACT = Decimal("1.5")
+
 
 @dataclass
 class SimulatedFill:
@@ -23,46 +30,70 @@ class BacktestFillSimulator:
         self.limit_fill_model = limit_fill_model
         self.realism_level = realism_level.upper()
         self.rng = np.random.default_rng(seed)
+        self._fill_time_buf = np.empty(0)
+        self._fill_time_idx = 0
+
+        # Resolve the realism branch once instead of re-testing it per order.
+        # Unrecognised levels keep the REALISTIC behaviour, as before.
+        market_fns = {
+            "INSTANT": self._fill_instant,
+            "ADVERSE": self._fill_market_adverse,
+        }
+        self._market_fn = market_fns.get(self.realism_level, self._fill_market)
+        self._limit_fn = self._fill_instant if self.realism_level == "INSTANT" else self._fill_limit
 
     def simulate_fill(self, order, market_state, slippage_config) -> Optional[SimulatedFill]:
-        from ...domain.models.order import OrderType, Side
+        if order.order_type == OrderType.MARKET:
+            return self._market_fn(order, market_state, slippage_config)
+        return self._limit_fn(order, market_state, slippage_config)
 
-        if self.realism_level == "INSTANT":
-            return SimulatedFill(
-                order_id=order.id,
-                fill_price=market_state.mid,
-                fill_qty=order.qty,
-                slippage=Decimal("0"),
-                fill_time_offset=timedelta(0),
-            )
+    def _fill_instant(self, order, market_state, slippage_config) -> SimulatedFill:
+        return SimulatedFill(
+            order_id=order.id,
+            fill_price=market_state.mid,
+            fill_qty=order.qty,
+            slippage=_ZERO,
+            fill_time_offset=timedelta(0),
+        )
 
-        if order.order_type == OrderType.MARKET:
-            slippage = self.slippage_model.estimate_slippage(order, market_state, slippage_config)
-            if self.realism_level == "ADVERSE":
-                # Stress: worst side of book plus extra impact
-                slippage *= Decimal("1.5")
-            fill_price = (
-                market_state.ask + slippage if order.side == Side.BUY else market_state.bid - slippage
-            )
-            return SimulatedFill(
-                order_id=order.id,
-                fill_price=fill_price,
-                fill_qty=order.qty,
-                slippage=slippage,
-                fill_time_offset=timedelta(seconds=self.rng.exponential(0.1)),
-            )
+    def _fill_market(self, order, market_state, slippage_config) -> SimulatedFill:
+        slippage = self.slippage_model.estimate_slippage(order, market_state, slippage_config)
+        return self._market_fill_at(order, market_state, slippage)
+
+    def _fill_market_adverse(self, order, market_state, slippage_config) -> SimulatedFill:
+        # Stress: worst side of book plus extra impact
+        slippage = self.slippage_model.estimate_slippage(order, market_state, slippage_config)
+        return self._market_fill_at(order, market_state, slippage * _ADVERSE_IMPACT)
 
-        if self.limit_fill_model:
-            fill_time = self.limit_fill_model.simulate_fill_time(order, market_state, 300, self.rng)
-            if fill_time is None:
-                return None
-            return SimulatedFill(
-                order_id=order.id,
-                fill_price=order.limit_price,
-                fill_qty=order.qty,
-                slippage=Decimal("0"),
-                fill_time_offset=timedelta(seconds=fill_time),
-            )
+    def _market_fill_at(self, order, market_state, slippage: Decimal) -> SimulatedFill:
+        fill_price = market_state.ask + slippage if order.side == Side.BUY else market_state.bid - slippage
+        return SimulatedFill(
+            order_id=order.id,
+            fill_price=fill_price,
+            fill_qty=order.qty,
+            slippage=slippage,
+            fill_time_offset=timedelta(seconds=self._next_fill_time()),
+        )
 
-        return None
+    def _fill_limit(self, order, market_state, slippage_config) -> Optional[SimulatedFill]:
+        if not self.limit_fill_model:
+            return None
+        fill_time = self.limit_fill_model.simulate_fill_time(order, market_state, 300, self.rng)
+        if fill_time is None:
+            return None
+        return SimulatedFill(
+            order_id=order.id,
+            fill_price=order.limit_price,
+            fill_qty=order.qty,
+            slippage=_ZERO,
+            fill_time_offset=timedelta(seconds=fill_time),
+        )
 
+    def _next_fill_time(self) -> float:
+        """Next Exp(0.1s) market fill delay from the pre-drawn block."""
+        if self._fill_time_idx >= len(self._fill_time_buf):
+            self._fill_time_buf = self.rng.exponential(0.1, size=_FILL_TIME_BATCH)
+            self._fill_time_idx = 0
+        delay = self._fill_time_buf[self._fill_time_idx]
+        self._fill_time_idx += 1
+        return float(delay)
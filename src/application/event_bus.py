@@ -1,16 +1,22 @@
 import asyncio
-from typing import Dict, Type, List, Callable, Awaitable, Optional
-from collections import defaultdict
+from typing import Deque, Dict, Type, Tuple, Callable, Awaitable, Optional
+from collections import deque
+
+from loguru import logger
 
 
 class EventBus:
     """Pub/sub backbone with optional per-key ordering."""
 
     def __init__(self):
-        self._handlers: Dict[Type, List[Callable]] = defaultdict(list)
+        # Tuples are replaced, never mutated, so dispatch can iterate without copying.
+        self._handlers: Dict[Type, Tuple[Callable, ...]] = {}
         self._queue: asyncio.Queue = asyncio.Queue()
-        self._ordered_queues: Dict[str, asyncio.Queue] = {}
-        self._ordered_tasks: Dict[str, asyncio.Task] = {}
+        # Per-key FIFOs drained by one worker; a key is in _ready iff its FIFO is non-empty.
+        self._ordered: Dict[str, Deque["Event"]] = {}
+        self._ready: Deque[str] = deque()
+        self._ordered_wakeup = asyncio.Event()
+        self._ordered_task: Optional[asyncio.Task] = None
         self._running = False
 
     def subscribe(
@@ -19,18 +25,22 @@ class EventBus:
         handler: Callable[["Event"], Awaitable[None]],
     ):
         """Subscribe handler to event type."""
-        self._handlers[event_type].append(handler)
+        self._handlers[event_type] = self._handlers.get(event_type, ()) + (handler,)
 
     async def publish(self, event: "Event", sequence_key: Optional[str] = None):
         """Publish event; when sequence_key is provided, preserve ordering per key."""
         if sequence_key:
-            if sequence_key not in self._ordered_queues:
-                queue = asyncio.Queue()
-                self._ordered_queues[sequence_key] = queue
-                self._ordered_tasks[sequence_key] = asyncio.create_task(
-                    self._run_ordered(sequence_key)
-                )
-            await self._ordered_queues[sequence_key].put(event)
+            pending = self._ordered.get(sequence_key)
+            if pending is None:
+                pending = self._ordered[sequence_key] = deque()
+            if not pending:
+                self._ready.append(sequence_key)
+            pending.append(event)
+            self._ordered_wakeup.set()
+            task = self._ordered_task
+            if task is None or task.done():
+                # First keyed publish, or the worker died: (re)start it.
+                self._ordered_task = asyncio.create_task(self._run_ordered())
         else:
             await self._queue.put(event)
 
@@ -47,28 +57,47 @@ class EventBus:
     async def stop(self):
         """Stop the bus and all ordered workers."""
         self._running = False
-        for task in self._ordered_tasks.values():
-            task.cancel()
-        await asyncio.gather(*self._ordered_tasks.values(), return_exceptions=True)
-        self._ordered_tasks.clear()
-        self._ordered_queues.clear()
+        if self._ordered_task is not None:
+            self._ordered_task.cancel()
+            await asyncio.gather(self._ordered_task, return_exceptions=True)
+            self._ordered_task = None
+        self._ordered.clear()
+        self._ready.clear()
 
-    async def _run_ordered(self, key: str):
-        """Dedicated loop per sequence key to keep ordering stable."""
-        queue = self._ordered_queues[key]
-        while self._running:
-            try:
-                event = await queue.get()
-                await self._dispatch(event)
-            except asyncio.CancelledError:
-                break
+    async def _run_ordered(self):
+        """
+        Single worker for all sequence keys: round-robin one event per ready key,
+        so each key stays FIFO and no key starves the others. A failing event is
+        logged and skipped so it cannot stop ordered delivery for every key.
+        """
+        while True:
+            while self._ready:
+                key = self._ready.popleft()
+                pending = self._ordered[key]
+                event = pending.popleft()
+                if pending:
+                    self._ready.append(key)
+                else:
+                    del self._ordered[key]  # idle keys hold no memory
+                try:
+                    await self._dispatch(event)
+                except Exception:
+                    logger.exception(f"Ordered dispatch failed for {type(event).__name__} (key={key})")
+            self._ordered_wakeup.clear()
+            await self._ordered_wakeup.wait()
 
     async def _dispatch(self, event: "Event"):
-        event_type = type(event)
-        for handler in self._handlers.get(event_type, []):
+        handlers = self._handlers.get(type(event))
+        if not handlers:
+            return
+        # One try around the loop; on error, log and resume the same iterator
+        # so the remaining handlers still run in subscription order.
+        remaining = iter(handlers)
+        while True:
             try:
-                await handler(event)
-            except Exception as exc:
-                # In production replace with structured logging
-                print(f"Handler error for {event_type}: {exc}")
+                for handler in remaining:
+                    await handler(event)
+                return
+            except Exception:
+                logger.exception(f"Handler error for {type(event).__name__}")
 
@@ -0,0 +1,21 @@
+import asyncio
+from typing import Awaitable, Iterable, List, TypeVar
+
+T = TypeVar("T")
+
+
+async def gather_limited(aws: Iterable[Awaitable[T]], limit: int) -> List[T]:
+    """
+    asyncio.gather with at most `limit` awaitables in flight.
+
+    Keeps fan-out under a provider's request ceiling so a large symbol set
+    does not trip 429 back-offs. Results follow input order; the first
+    exception propagates, as with plain gather.
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def _run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return list(await asyncio.gather(*(_run(aw) for aw in aws)))
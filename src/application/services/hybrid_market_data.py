@@ -1,11 +1,17 @@
+import asyncio
 from decimal import Decimal
 from typing import Optional, List, Dict, Tuple
-from datetime import datetime, timedelta
 
+from cachetools import TTLCache
 from loguru import logger
 
 from ...ports.market_data import MarketDataPort, Tick
 from ...domain.models.perp_metrics import PerpMetrics
+from .gather_limited import gather_limited
+
+_TICK_CACHE_SIZE = 4096
+_HOURS_PER_DAY = Decimal(24)
+_ONE = Decimal(1)
 
 
 class HybridMarketDataService:
@@ -20,27 +26,51 @@ class HybridMarketDataService:
         coingecko_adapter: MarketDataPort,
         enabled: bool = True,
         cache_ttl_seconds: int = 0,
+        max_concurrency: int = 8,
     ):
         self.coingecko = coingecko_adapter
         self.enabled = enabled
-        self._cache_ttl = timedelta(seconds=cache_ttl_seconds)
-        self._tick_cache: Dict[str, Tuple[datetime, Tick]] = {}
+        self.max_concurrency = max_concurrency
+        self._cache_ttl = float(cache_ttl_seconds)
+        # Bounded and expiring on a monotonic clock; stale symbols are evicted
+        # instead of lingering for the life of the process. With the default
+        # TTL of 0 there is no service-level cache and get_tick forwards straight
+        # to the adapter. When enabling it, build the adapter with its own cache
+        # off (CoinGecko: cache_ttl=0) so ticks are not cached twice.
+        self._tick_cache: Optional[TTLCache] = (
+            TTLCache(maxsize=_TICK_CACHE_SIZE, ttl=self._cache_ttl) if self._cache_ttl > 0 else None
+        )
 
     async def get_tick(self, symbol: str) -> Tick:
-        now = datetime.utcnow()
-        cached = self._tick_cache.get(symbol)
-        if cached and self._cache_ttl.total_seconds() > 0:
-            ts, tick = cached
-            if now - ts < self._cache_ttl:
-                return tick
+        if self._tick_cache is None:
+            return await self.coingecko.get_tick(symbol)
+
+        tick = self._tick_cache.get(symbol)
+        if tick is not None:
+            return tick
 
         tick = await self.coingecko.get_tick(symbol)
-        self._tick_cache[symbol] = (now, tick)
+        self._tick_cache[symbol] = tick
         return tick
 
+    async def get_ticks(self, symbols: List[str]) -> List[Tick]:
+        """Fetch several ticks with at most `max_concurrency` requests in flight."""
+        return await gather_limited((self.get_tick(s) for s in symbols), limit=self.max_concurrency)
+
     async def get_ohlcv(self, symbol: str, timeframe: str, limit: int = 200):
         return await self.coingecko.get_ohlcv(symbol, timeframe, limit)
 
+    async def get_ohlcv_many(self, specs: List[Tuple[str, str, int]]) -> List[List[Dict]]:
+        """
+        Fetch OHLCV for several (symbol, timeframe, limit) specs concurrently.
+
+        At most `max_concurrency` requests are in flight; results follow `specs` order.
+        """
+        return await gather_limited(
+            (self.get_ohlcv(symbol, timeframe, limit) for symbol, timeframe, limit in specs),
+            limit=self.max_concurrency,
+        )
+
     async def get_perp_metrics(self, symbol: str) -> Optional[PerpMetrics]:
         try:
             return await self.coingecko.get_perp_metrics(symbol)
@@ -53,17 +83,12 @@ class HybridMarketDataService:
         Synthetic perp proxy: spot price adjusted by funding basis.
         basis ≈ funding_rate * 24 hours * spot
         """
-        tick = await self.get_tick(symbol)
-        perp = await self.get_perp_metrics(symbol)
-        if not perp:
-            return None
-        basis = perp.funding_rate * Decimal("24")
-        return tick.price + (tick.price * basis)
+        tick, perp = await asyncio.gather(self.get_tick(symbol), self.get_perp_metrics(symbol))
+        return self._perp_proxy_price(tick, perp)
 
     async def build_enriched_tick(self, symbol: str) -> Dict:
-        tick = await self.get_tick(symbol)
-        perp = await self.get_perp_metrics(symbol)
-        proxy = await self.get_perp_proxy_price(symbol)
+        # Spot and perp are independent requests; fetch them together, once.
+        tick, perp = await asyncio.gather(self.get_tick(symbol), self.get_perp_metrics(symbol))
         return {
             "symbol": symbol,
             "spot_price": tick.price,
@@ -71,6 +96,18 @@ class HybridMarketDataService:
             "perp_funding": perp.funding_rate if perp else None,
             "open_interest": perp.open_interest if perp else None,
             "volume_24h": perp.volume_24h if perp else None,
-            "perp_proxy_price": proxy,
+            "perp_proxy_price": self._perp_proxy_price(tick, perp),
         }
 
+    async def build_enriched_ticks(self, symbols: List[str]) -> List[Dict]:
+        """Enrich several symbols concurrently; results follow `symbols` order."""
+        return await gather_limited(
+            (self.build_enriched_tick(s) for s in symbols), limit=self.max_concurrency
+        )
+
+    @staticmethod
+    def _perp_proxy_price(tick: Tick, perp: Optional[PerpMetrics]) -> Optional[Decimal]:
+        if not perp:
+            return None
+        basis = perp.funding_rate * _HOURS_PER_DAY
+        return tick.price * (_ONE + basis)
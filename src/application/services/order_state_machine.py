@@ -1,8 +1,26 @@
 from datetime import datetime
-from typing import Dict
+from typing import Dict, FrozenSet, Optional
 
+from ...domain.models.clock import Clock
 from ...domain.models.order import Order, OrderStatus
 
+_EMPTY: FrozenSet[OrderStatus] = frozenset()
+
+# Built once at import and shared by every state machine; terminal states map to _EMPTY.
+_TRANSITIONS: Dict[OrderStatus, FrozenSet[OrderStatus]] = {
+    OrderStatus.NEW: frozenset({OrderStatus.PENDING, OrderStatus.REJECTED, OrderStatus.CANCELED}),
+    OrderStatus.PENDING: frozenset({OrderStatus.SUBMITTED, OrderStatus.REJECTED, OrderStatus.CANCELED}),
+    OrderStatus.SUBMITTED: frozenset(
+        {
+            OrderStatus.FILLED,
+            OrderStatus.PARTIALLY_FILLED,
+            OrderStatus.REJECTED,
+            OrderStatus.CANCELED,
+        }
+    ),
+    OrderStatus.PARTIALLY_FILLED: frozenset({OrderStatus.FILLED, OrderStatus.CANCELED}),
+}
+
 
 class InvalidTransition(Exception):
     """Raised when an invalid order state transition is attempted."""
@@ -11,19 +29,11 @@ class InvalidTransition(Exception):
 class OrderStateMachine:
     """Tracks order lifecycle with explicit transition rules."""
 
-    def __init__(self):
+    def __init__(self, clock: Optional[Clock] = None):
         self.orders: Dict[str, Order] = {}
-        self._transitions = {
-            OrderStatus.NEW: {OrderStatus.PENDING, OrderStatus.REJECTED, OrderStatus.CANCELED},
-            OrderStatus.PENDING: {OrderStatus.SUBMITTED, OrderStatus.REJECTED, OrderStatus.CANCELED},
-            OrderStatus.SUBMITTED: {
-                OrderStatus.FILLED,
-                OrderStatus.PARTIALLY_FILLED,
-                OrderStatus.REJECTED,
-                OrderStatus.CANCELED,
-            },
-            OrderStatus.PARTIALLY_FILLED: {OrderStatus.FILLED, OrderStatus.CANCELED},
-        }
+        self._transitions = _TRANSITIONS
+        # Backtests pass their Clock so transitions are stamped with simulated time.
+        self._clock = clock
 
     def add_order(self, order: Order):
         """Add order to tracking."""
@@ -31,21 +41,27 @@ class OrderStateMachine:
 
     def can_transition(self, order_id: str, to_state: OrderStatus) -> bool:
         order = self.orders.get(order_id)
-        if not order:
+        if order is None:
             return False
-        current = order.status
-        valid_next = self._transitions.get(current, set())
-        return to_state in valid_next
-
-    def transition(self, order_id: str, to_state: OrderStatus) -> Order:
-        """Execute state transition."""
-        if not self.can_transition(order_id, to_state):
-            order = self.orders.get(order_id)
-            current = order.status if order else "UNKNOWN"
-            raise InvalidTransition(f"{current} -> {to_state}")
-
-        order = self.orders[order_id]
+        return to_state in self._transitions.get(order.status, _EMPTY)
+
+    def transition(self, order_id: str, to_state: OrderStatus, *, now: Optional[datetime] = None) -> Order:
+        """
+        Execute state transition.
+
+        `now` stamps last_update_at; otherwise the injected Clock is used, and
+        only without one is the wall clock read.
+        """
+        # Single lookup; can_transition() is kept for callers that only probe.
+        order = self.orders.get(order_id)
+        if order is None:
+            raise InvalidTransition(f"UNKNOWN -> {to_state}")
+        if to_state not in self._transitions.get(order.status, _EMPTY):
+            raise InvalidTransition(f"{order.status} -> {to_state}")
+
         order.status = to_state
-        order.last_update_at = datetime.utcnow()
+        if now is None:
+            now = self._clock.now if self._clock is not None else datetime.utcnow()
+        order.last_update_at = now
         return order
 
@@ -1,15 +1,21 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Dict, List, Any, Optional
 
 
-@dataclass
+@dataclass(frozen=True)
 class RiskConfig:
     max_position_size: Decimal
     max_leverage: Decimal
     max_daily_loss: Decimal
     max_notional_per_order: Decimal
     fat_finger_multiplier: float = 10.0
+    # -max_daily_loss, negated once here rather than on every kill-switch check.
+    # Frozen so the floor cannot drift from max_daily_loss; reload via dataclasses.replace().
+    daily_loss_floor: Decimal = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "daily_loss_floor", -self.max_daily_loss)
 
 
 @dataclass
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class Event:
     id: str
     timestamp: datetime
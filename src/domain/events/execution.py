@@ -4,7 +4,7 @@ from decimal import Decimal
 from .base import Event
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class FillEvent(Event):
     execution_report: "ExecutionReport"
     position_delta: Decimal
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from .base import Event
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class OrderEvent(Event):
     order: "Order"
     reason: str  # "SIGNAL" | "RISK_ADJUST" | "REBALANCE"
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from .base import Event
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class RegimeChangeEvent(Event):
     old_regime: "Regime"
     new_regime: "Regime"
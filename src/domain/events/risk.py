@@ -4,7 +4,7 @@ from typing import Dict, Any
 from .base import Event
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class RiskBlockEvent(Event):
     signal: "Signal"
     rule_name: str
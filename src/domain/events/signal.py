@@ -6,7 +6,7 @@ from typing import Dict, Any
 from .base import Event
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class Signal:
     """Model output - what we want to do."""
 
@@ -19,7 +19,7 @@ class Signal:
     account_id: str = "live"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class SignalEvent(Event):
     signal: Signal
 
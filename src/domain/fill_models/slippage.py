@@ -2,6 +2,11 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from decimal import Decimal
 
+import numpy as np
+
+_Q6 = Decimal("0.000001")
+_DEFAULT_VOL = 0.2
+
 
 @dataclass
 class SlippageConfig:
@@ -27,7 +32,7 @@ class AlmgrenChrissSlippage(SlippageModel):
 
         mid = float(market_state.mid)
         spread = float(market_state.spread)
-        vol = float(market_state.vol_estimate) if market_state.vol_estimate else 0.2
+        vol = float(market_state.vol_estimate) if market_state.vol_estimate else _DEFAULT_VOL
         adv = float(market_state.features.get("adv", 1_000_000))
         order_size = float(order.qty)
 
@@ -39,5 +44,30 @@ class AlmgrenChrissSlippage(SlippageModel):
         perm_impact = config.permanent_impact_epsilon * participation_rate * mid
 
         total = fixed_cost + spread_cost + temp_impact + perm_impact
-        return Decimal(str(round(total, 6)))
+        return Decimal(total).quantize(_Q6)
+
+    def estimate_slippage_batch(
+        self,
+        order_size: np.ndarray,
+        mid: np.ndarray,
+        spread: np.ndarray,
+        vol: np.ndarray,
+        adv: np.ndarray,
+        is_market: np.ndarray,
+        config: SlippageConfig,
+    ) -> np.ndarray:
+        """
+        Same model as estimate_slippage over N candidate orders at once.
+
+        All inputs are float64 arrays of equal length (is_market is boolean);
+        a zero vol falls back to the default, as in the scalar path. Returns
+        unquantized float64 slippage per order.
+        """
+        vol = np.where(vol == 0, _DEFAULT_VOL, vol)
+        participation_rate = order_size / adv
+        fixed_cost = mid * (config.fixed_bps / 10000)
+        spread_cost = np.where(is_market, spread * config.spread_fraction, 0.0)
+        temp_impact = config.temporary_impact_eta * (participation_rate ** config.temporary_impact_gamma) * mid * vol
+        perm_impact = config.permanent_impact_epsilon * participation_rate * mid
+        return fixed_cost + spread_cost + temp_impact + perm_impact
 
@@ -10,7 +10,7 @@ class SessionType(Enum):
     CLOSED = "CLOSED"
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class Clock:
     """Explicit time model for deterministic backtests."""
 
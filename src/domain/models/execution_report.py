@@ -6,7 +6,7 @@ from typing import Optional, Dict, Any
 from .order import OrderStatus
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class ExecutionReport:
     """Venue-agnostic fill/cancel/reject notification."""
 
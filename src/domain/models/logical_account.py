@@ -10,7 +10,7 @@ class AccountRole(Enum):
     HEDGE = "HEDGE"
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class LogicalAccount:
     """Venue-agnostic capital bucket."""
 
@@ -3,8 +3,11 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Dict
 
+_ZERO = Decimal("0")
+_HALF = Decimal("0.5")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True, kw_only=True)
 class MarketState:
     symbol: str
     timestamp: datetime
@@ -21,17 +24,22 @@ class MarketState:
     @classmethod
     def from_tick(cls, tick: "Tick") -> "MarketState":
         """Convert raw tick to normalized market state."""
-        mid = (tick.bid + tick.ask) / 2 if tick.bid and tick.ask else tick.price
-        spread = tick.ask - tick.bid if tick.bid and tick.ask else Decimal("0")
+        bid, ask = tick.bid, tick.ask
+        if bid and ask:
+            mid = (bid + ask) * _HALF
+            spread = ask - bid
+        else:
+            mid = tick.price
+            spread = _ZERO
         return cls(
             symbol=tick.symbol,
             timestamp=tick.timestamp,
             mid=mid,
-            bid=tick.bid or mid,
-            ask=tick.ask or mid,
+            bid=bid or mid,
+            ask=ask or mid,
             spread=spread,
-            vol_estimate=Decimal("0"),
-            liquidity_score=Decimal("0"),
+            vol_estimate=_ZERO,
+            liquidity_score=_ZERO,
             features={},
             regime_indicators={},
         )
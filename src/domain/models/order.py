@@ -31,7 +31,7 @@ class Side(Enum):
 OrderId = str  # Type alias for clarity
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class Order:
     id: OrderId
     symbol: str
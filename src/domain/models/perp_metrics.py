@@ -3,7 +3,7 @@ from decimal import Decimal
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
 class PerpMetrics:
     """Perpetual futures metrics from derivative venues."""
 
@@ -4,7 +4,7 @@ from decimal import Decimal
 from typing import Dict
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class Portfolio:
     accounts: Dict[str, "LogicalAccount"]
     positions: Dict[str, "Position"]
@@ -1,9 +1,13 @@
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
+from typing import Optional
 
+_ZERO = Decimal(0)
+_DUST_QTY = Decimal("0.0001")
 
-@dataclass
+
+@dataclass(slots=True, kw_only=True)
 class Position:
     symbol: str
     quantity: Decimal  # positive = long, negative = short
@@ -13,19 +17,18 @@ class Position:
     last_updated: datetime
     account_id: str
 
-    def update(self, fill_qty: Decimal, fill_price: Decimal):
-        """Update position from a fill."""
-        if self.quantity == Decimal("0"):
+    def update(self, fill_qty: Decimal, fill_price: Decimal, *, now: Optional[datetime] = None):
+        """Update position from a fill; `now` lets batch callers read the clock once."""
+        qty = self.quantity
+        new_qty = qty + fill_qty
+        if qty and fill_qty and (qty > _ZERO) == (fill_qty > _ZERO):
+            # Adding to the position: size-weighted average entry.
+            self.avg_entry_price = (qty * self.avg_entry_price + fill_qty * fill_price) / new_qty
+        elif not qty:
             self.avg_entry_price = fill_price
-            self.quantity = fill_qty
-        elif (self.quantity > 0 and fill_qty > 0) or (self.quantity < 0 and fill_qty < 0):
-            total_cost = self.quantity * self.avg_entry_price + fill_qty * fill_price
-            self.quantity += fill_qty
-            self.avg_entry_price = total_cost / self.quantity
-        else:
-            self.quantity += fill_qty
-            if abs(self.quantity) < Decimal("0.0001"):
-                self.quantity = Decimal("0")
-
-        self.last_updated = datetime.utcnow()
+        elif abs(new_qty) < _DUST_QTY:
+            # Reducing or flipping keeps the entry price; snap dust to flat.
+            new_qty = _ZERO
+        self.quantity = new_qty
 
+        self.last_updated = now if now is not None else datetime.utcnow()
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from decimal import Decimal
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True, kw_only=True)
 class Price:
     """Monetary price value object with positivity guard."""
     value: Decimal
@@ -12,7 +12,7 @@ class Price:
             raise ValueError("Price must be positive")
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True, kw_only=True)
 class Quantity:
     """Signed quantity (can be negative for shorts)."""
     value: Decimal
@@ -22,7 +22,7 @@ class Quantity:
             raise ValueError("Quantity cannot be zero")
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True, kw_only=True)
 class Notional:
     """Notional amount; must be non-negative."""
     value: Decimal
@@ -11,7 +11,7 @@ class Regime(Enum):
     UNCERTAIN = "UNCERTAIN"
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class RegimeState:
     current: Regime
     confidence: float
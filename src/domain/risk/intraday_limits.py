@@ -1,10 +1,16 @@
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, Optional
+
+_ZERO = Decimal(0)
 
 
 class IntradayRiskLimits:
     """Runtime risk monitoring."""
 
+    def __init__(self, vol_threshold: float = 0.5):
+        self.vol_threshold = vol_threshold
+        self._inv_vol_threshold = 1.0 / vol_threshold
+
     def check_account_drawdown(
         self,
         account: "LogicalAccount",
@@ -20,16 +26,19 @@ class IntradayRiskLimits:
         pnl_tracker: Dict[str, Decimal],
         max_strategy_loss: Decimal,
     ) -> bool:
-        strategy_pnl = pnl_tracker.get(strategy_id, Decimal("0"))
+        strategy_pnl = pnl_tracker.get(strategy_id, _ZERO)
         return strategy_pnl > -max_strategy_loss
 
     def check_volatility_regime(
         self,
         market_state: "MarketState",
-        vol_threshold: float = 0.5,
+        vol_threshold: Optional[float] = None,
     ) -> float:
+        """Size multiplier: 1.0 up to the threshold, scaled down linearly above it, floored at 0.2."""
         vol = float(market_state.vol_estimate)
-        if vol > vol_threshold:
-            return max(0.2, 1.0 - (vol - vol_threshold) / vol_threshold)
-        return 1.0
-
+        threshold = self.vol_threshold if vol_threshold is None else vol_threshold
+        if vol <= threshold:
+            return 1.0
+        inv = self._inv_vol_threshold if vol_threshold is None else 1.0 / vol_threshold
+        # 1 - (vol - t) / t == 2 - vol / t
+        return max(0.2, 2.0 - vol * inv)
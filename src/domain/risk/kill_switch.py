@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class TradingContext:
     """Context for kill switch checks."""
 
@@ -22,7 +22,7 @@ class KillSwitch:
         if self.triggered:
             return True
 
-        if context.portfolio.daily_pnl < -context.config.max_daily_loss:
+        if context.portfolio.daily_pnl < context.config.daily_loss_floor:
             self.trigger("Daily loss limit exceeded")
             return True
 
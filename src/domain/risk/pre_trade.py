@@ -2,14 +2,25 @@ from dataclasses import dataclass
 from decimal import Decimal
 from typing import Optional
 
+_ZERO = Decimal(0)
+# Leverage reported for an account with no capital (effectively unbounded).
+_NO_CAPITAL_LEVERAGE = Decimal(999)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True, kw_only=True)
 class PreTradeCheck:
     passed: bool
     reason: Optional[str]
     rule_name: str
 
 
+# Passing results are immutable and identical per rule, so share one instance each.
+_PASS_POSITION_LIMIT = PreTradeCheck(passed=True, reason=None, rule_name="POSITION_LIMIT")
+_PASS_LEVERAGE = PreTradeCheck(passed=True, reason=None, rule_name="LEVERAGE")
+_PASS_FAT_FINGER = PreTradeCheck(passed=True, reason=None, rule_name="FAT_FINGER")
+_PASS_NOTIONAL_LIMIT = PreTradeCheck(passed=True, reason=None, rule_name="NOTIONAL_LIMIT")
+
+
 class PreTradeRules:
     """Checks before order submission."""
 
@@ -19,7 +30,7 @@ class PreTradeRules:
         position: Optional["Position"],
         max_size: Decimal,
     ) -> PreTradeCheck:
-        current = position.quantity if position else Decimal("0")
+        current = position.quantity if position else _ZERO
         proposed = current + signal.target_position
         if abs(proposed) > max_size:
             return PreTradeCheck(
@@ -27,7 +38,7 @@ class PreTradeRules:
                 reason=f"Position {proposed} exceeds max {max_size}",
                 rule_name="POSITION_LIMIT",
             )
-        return PreTradeCheck(passed=True, reason=None, rule_name="POSITION_LIMIT")
+        return _PASS_POSITION_LIMIT
 
     def check_leverage(
         self,
@@ -38,14 +49,19 @@ class PreTradeRules:
     ) -> PreTradeCheck:
         notional = abs(signal.target_position) * current_price
         account_capital = portfolio.total_value * account.capital_pct
-        leverage = notional / account_capital if account_capital > 0 else Decimal("999")
-        if leverage > account.max_leverage:
+        if account_capital > 0:
+            # notional / capital > max  <=>  notional > max * capital; divide only to report.
+            breached = notional > account.max_leverage * account_capital
+        else:
+            breached = _NO_CAPITAL_LEVERAGE > account.max_leverage
+        if breached:
+            leverage = notional / account_capital if account_capital > 0 else _NO_CAPITAL_LEVERAGE
             return PreTradeCheck(
                 passed=False,
                 reason=f"Leverage {leverage:.2f} exceeds max {account.max_leverage}",
                 rule_name="LEVERAGE",
             )
-        return PreTradeCheck(passed=True, reason=None, rule_name="LEVERAGE")
+        return _PASS_LEVERAGE
 
     def check_fat_finger(
         self,
@@ -60,7 +76,7 @@ class PreTradeRules:
                 reason=f"Order size {signal.target_position} exceeds 10% ADV",
                 rule_name="FAT_FINGER",
             )
-        return PreTradeCheck(passed=True, reason=None, rule_name="FAT_FINGER")
+        return _PASS_FAT_FINGER
 
     def check_notional_limit(
         self,
@@ -75,5 +91,5 @@ class PreTradeRules:
                 reason=f"Notional {notional} exceeds max {max_notional}",
                 rule_name="NOTIONAL_LIMIT",
             )
-        return PreTradeCheck(passed=True, reason=None, rule_name="NOTIONAL_LIMIT")
+        return _PASS_NOTIONAL_LIMIT
 
@@ -3,6 +3,16 @@ from typing import Dict
 
 from ..models.regime import Regime
 
+_ZERO = Decimal(0)
+
+# Regime -> account share of capital, parsed once at import.
+_ALLOCATIONS: Dict[Regime, Dict[str, Decimal]] = {
+    Regime.TREND: {"live": Decimal("0.7"), "experimental": Decimal("0.2"), "hedge": Decimal("0.1")},
+    Regime.MEAN_REVERSION: {"live": Decimal("0.8"), "experimental": Decimal("0.1"), "hedge": Decimal("0.1")},
+    Regime.MICROSTRUCTURE: {"live": Decimal("0.6"), "experimental": Decimal("0.3"), "hedge": Decimal("0.1")},
+    Regime.UNCERTAIN: {"live": Decimal("0.5"), "experimental": Decimal("0.2"), "hedge": Decimal("0.3")},
+}
+
 
 class WalletAllocationRules:
     """Multi-wallet capital management."""
@@ -13,15 +23,8 @@ class WalletAllocationRules:
         total_capital: Decimal,
         accounts: Dict[str, "LogicalAccount"],
     ) -> Dict[str, Decimal]:
-        allocations = {
-            Regime.TREND: {"live": 0.70, "experimental": 0.20, "hedge": 0.10},
-            Regime.MEAN_REVERSION: {"live": 0.80, "experimental": 0.10, "hedge": 0.10},
-            Regime.MICROSTRUCTURE: {"live": 0.60, "experimental": 0.30, "hedge": 0.10},
-            Regime.UNCERTAIN: {"live": 0.50, "experimental": 0.20, "hedge": 0.30},
-        }
-        regime_alloc = allocations.get(regime, allocations[Regime.UNCERTAIN])
+        regime_alloc = _ALLOCATIONS.get(regime, _ALLOCATIONS[Regime.UNCERTAIN])
         return {
-            account_id: total_capital * Decimal(str(regime_alloc.get(account_id, 0)))
-            for account_id in accounts.keys()
+            account_id: total_capital * regime_alloc.get(account_id, _ZERO)
+            for account_id in accounts
         }
-
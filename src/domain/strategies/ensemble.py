@@ -31,23 +31,27 @@ class EnsembleStrategy(TradingStrategy):
         if not active_models:
             return None
 
-        signals = []
+        # Single pass: the k-th emitted signal takes the k-th weight, as before.
+        n_signals = 0
+        weighted_sum = 0.0
+        total_weight = 0.0
+        confidence_sum = 0.0
         for model in active_models:
             sig = model.generate_signal(market_state, portfolio)
-            if sig:
-                signals.append(sig)
+            if not sig:
+                continue
+            if n_signals < len(model_weights):
+                w = model_weights[n_signals]
+                weighted_sum += float(sig.target_position) * w
+                total_weight += w
+            confidence_sum += sig.confidence
+            n_signals += 1
 
-        if not signals:
+        if not n_signals:
             return None
 
-        total_weight = sum(model_weights[: len(signals)])
-        weighted_position = (
-            sum(float(sig.target_position) * w for sig, w in zip(signals, model_weights))
-            / total_weight
-            if total_weight > 0
-            else 0
-        )
-        avg_confidence = sum(sig.confidence for sig in signals) / len(signals)
+        weighted_position = weighted_sum / total_weight if total_weight > 0 else 0
+        avg_confidence = confidence_sum / n_signals
 
         return Signal(
             strategy_id="ensemble",
@@ -57,8 +61,8 @@ class EnsembleStrategy(TradingStrategy):
             timestamp=datetime.utcnow(),
             metadata={
                 "regime": regime.value,
-                "component_signals": len(signals),
-                "weights": model_weights[: len(signals)],
+                "component_signals": n_signals,
+                "weights": model_weights[:n_signals],
             },
         )
 
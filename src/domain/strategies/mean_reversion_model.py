@@ -1,11 +1,19 @@
-from typing import Optional
+from collections import deque
+from typing import Deque, Optional
 from decimal import Decimal
 from datetime import datetime
-import statistics
+import math
 
 from .base import TradingStrategy
 from ..events.signal import Signal
 
+_LONG = Decimal(100)
+_SHORT = Decimal(-100)
+_FLAT = Decimal(0)
+
+# Variance below this fraction of mean^2 is float noise from the running sums, i.e. a flat window.
+_FLAT_VAR_REL = 1e-12
+
 
 class MeanReversionModel(TradingStrategy):
     """Mean reversion strategy."""
@@ -14,34 +22,51 @@ class MeanReversionModel(TradingStrategy):
         self.window = window
         self.entry_z = entry_z
         self.exit_z = exit_z
-        self.price_history: list = []
+        self.price_history: Deque[float] = deque(maxlen=window)
+        # Running sum / sum of squares over the window: O(1) mean and stdev per tick.
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._evictions = 0
 
     def generate_signal(
         self,
         market_state: "MarketState",
         portfolio: "Portfolio",
     ) -> Optional[Signal]:
-        self.price_history.append(float(market_state.mid))
-        if len(self.price_history) > self.window:
-            self.price_history.pop(0)
+        history = self.price_history
+        price = float(market_state.mid)
+        if len(history) == self.window:
+            oldest = history[0]  # about to be evicted by maxlen
+            self._sum -= oldest
+            self._sum_sq -= oldest * oldest
+            self._evictions += 1
+        history.append(price)
+        self._sum += price
+        self._sum_sq += price * price
+        if self._evictions >= self.window:
+            # Re-anchor once per full turnover so add/subtract drift never accumulates.
+            self._evictions = 0
+            self._sum = math.fsum(history)
+            self._sum_sq = math.fsum(x * x for x in history)
 
-        if len(self.price_history) < self.window:
+        n = len(history)
+        if n < self.window:
             return None
 
-        mean = statistics.mean(self.price_history)
-        std = statistics.stdev(self.price_history)
-        if std == 0:
+        mean = self._sum / n
+        var = (self._sum_sq - self._sum * mean) / (n - 1)  # sample variance, as statistics.stdev
+        if var <= _FLAT_VAR_REL * mean * mean:
             return None
 
-        zscore = (self.price_history[-1] - mean) / std
+        zscore = (price - mean) / math.sqrt(var)
         current_pos = portfolio.positions.get(market_state.symbol)
-        current_qty = current_pos.quantity if current_pos else Decimal("0")
+        current_qty = current_pos.quantity if current_pos else _FLAT
 
         if zscore > self.entry_z and current_qty >= 0:
             return Signal(
                 strategy_id="mean_reversion",
                 symbol=market_state.symbol,
-                target_position=Decimal("-100"),
+                target_position=_SHORT,
                 confidence=min(1.0, abs(zscore) / 3),
                 timestamp=datetime.utcnow(),
                 metadata={"zscore": zscore},
@@ -50,7 +75,7 @@ class MeanReversionModel(TradingStrategy):
             return Signal(
                 strategy_id="mean_reversion",
                 symbol=market_state.symbol,
-                target_position=Decimal("100"),
+                target_position=_LONG,
                 confidence=min(1.0, abs(zscore) / 3),
                 timestamp=datetime.utcnow(),
                 metadata={"zscore": zscore},
@@ -59,7 +84,7 @@ class MeanReversionModel(TradingStrategy):
             return Signal(
                 strategy_id="mean_reversion",
                 symbol=market_state.symbol,
-                target_position=Decimal("0"),
+                target_position=_FLAT,
                 confidence=0.8,
                 timestamp=datetime.utcnow(),
                 metadata={"zscore": zscore, "action": "exit"},
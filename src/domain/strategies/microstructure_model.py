@@ -5,6 +5,9 @@ from datetime import datetime
 from .base import TradingStrategy
 from ..events.signal import Signal
 
+_LONG = Decimal(50)
+_SHORT = Decimal(-50)
+
 
 class MicrostructureModel(TradingStrategy):
     """Order-flow and microstructure signal model."""
@@ -26,7 +29,7 @@ class MicrostructureModel(TradingStrategy):
         if abs(imbalance) < self.imbalance_threshold:
             return None
 
-        target = Decimal("50") if imbalance > 0 else Decimal("-50")
+        target = _LONG if imbalance > 0 else _SHORT
         return Signal(
             strategy_id="microstructure",
             symbol=market_state.symbol,
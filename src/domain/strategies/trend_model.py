@@ -1,10 +1,14 @@
-from typing import Optional
+from collections import deque
+from typing import Deque, Optional
 from decimal import Decimal
 from datetime import datetime
 
 from .base import TradingStrategy
 from ..events.signal import Signal
 
+_LONG = Decimal(100)
+_SHORT = Decimal(-100)
+
 
 class TrendModel(TradingStrategy):
     """Momentum/trend following."""
@@ -12,16 +16,14 @@ class TrendModel(TradingStrategy):
     def __init__(self, lookback: int = 20, threshold: float = 0.02):
         self.lookback = lookback
         self.threshold = threshold
-        self.price_history: list = []
+        self.price_history: Deque[float] = deque(maxlen=lookback)
 
     def generate_signal(
         self,
         market_state: "MarketState",
         portfolio: "Portfolio",
     ) -> Optional[Signal]:
-        self.price_history.append(float(market_state.mid))
-        if len(self.price_history) > self.lookback:
-            self.price_history.pop(0)
+        self.price_history.append(float(market_state.mid))  # maxlen evicts the oldest
 
         if len(self.price_history) < self.lookback:
             return None
@@ -30,7 +32,7 @@ class TrendModel(TradingStrategy):
         if abs(returns) < self.threshold:
             return None
 
-        target = Decimal("100") if returns > 0 else Decimal("-100")
+        target = _LONG if returns > 0 else _SHORT
         return Signal(
             strategy_id="trend",
             symbol=market_state.symbol,
@@ -1,12 +1,19 @@
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict, List
-from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict, defaultdict
+from itertools import count
 import hashlib
+import heapq
 
+_ZERO = Decimal(0)
 
-@dataclass
+# (venue_fill_id, order_id, timestamp, qty, price) - hashed natively by the set.
+FillKey = Tuple[str, str, datetime, Decimal, Decimal]
+
+
+@dataclass(slots=True, kw_only=True)
 class FillFingerprint:
     venue_fill_id: str
     order_id: str
@@ -14,7 +21,13 @@ class FillFingerprint:
     qty: Decimal
     price: Decimal
 
+    @staticmethod
+    def key_of(fill: "ExecutionReport") -> FillKey:
+        """In-memory dedup key; no encoding or digest on the hot path."""
+        return (fill.venue_fill_id, fill.order_id, fill.timestamp, fill.filled_qty, fill.avg_fill_price or _ZERO)
+
     def hash(self) -> str:
+        """Stable short digest, for persistence or logs where a string id is needed."""
         content = f"{self.venue_fill_id}:{self.order_id}:{self.timestamp.isoformat()}:{self.qty}:{self.price}"
         return hashlib.sha256(content.encode()).hexdigest()[:16]
 
@@ -22,30 +35,36 @@ class FillFingerprint:
 class FillSequencer:
     """Handles out-of-order fills."""
 
-    def __init__(self, max_wait_seconds: float = 5.0):
+    def __init__(self, max_wait_seconds: float = 5.0, max_seen_fills: int = 100_000):
         self.max_wait_seconds = max_wait_seconds
-        self._pending_fills: Dict[str, List] = defaultdict(list)
+        self.max_seen_fills = max_seen_fills
+        # Per-order min-heap of (sequence_number, arrival, fill); arrival keeps ties FIFO.
+        self._pending_fills: Dict[str, List[Tuple[int, int, "ExecutionReport"]]] = defaultdict(list)
+        self._arrival = count()
+        # Oldest pending timestamp per order; None when unknown (recomputed on demand).
+        self._oldest_pending: Dict[str, Optional[datetime]] = {}
         self._expected_seq: Dict[str, int] = {}
-        self._seen_hashes: set = set()
+        # Dedup window of recent fill keys; oldest evicted first once full.
+        self._seen_keys: "OrderedDict[FillKey, None]" = OrderedDict()
 
     def receive_fill(self, fill: "ExecutionReport") -> List["ExecutionReport"]:
-        fingerprint = FillFingerprint(
-            venue_fill_id=fill.venue_fill_id,
-            order_id=fill.order_id,
-            timestamp=fill.timestamp,
-            qty=fill.filled_qty,
-            price=fill.avg_fill_price or Decimal("0"),
-        )
-        fill_hash = fingerprint.hash()
-        if fill_hash in self._seen_hashes:
+        fill_key = FillFingerprint.key_of(fill)
+        if fill_key in self._seen_keys:
             return []
 
-        self._seen_hashes.add(fill_hash)
+        seen = self._seen_keys
+        seen[fill_key] = None
+        if len(seen) > self.max_seen_fills:
+            seen.popitem(last=False)
         order_id = fill.order_id
         if order_id not in self._expected_seq:
             self._expected_seq[order_id] = 1
 
-        self._pending_fills[order_id].append(fill)
+        pending = self._pending_fills[order_id]
+        heapq.heappush(pending, (fill.sequence_number, next(self._arrival), fill))
+        oldest = self._oldest_pending.get(order_id)
+        if len(pending) == 1 or (oldest is not None and fill.timestamp < oldest):
+            self._oldest_pending[order_id] = fill.timestamp
         return self._release_ordered_fills(order_id)
 
     def _release_ordered_fills(self, order_id: str) -> List["ExecutionReport"]:
@@ -53,22 +72,32 @@ class FillSequencer:
         pending = self._pending_fills[order_id]
         expected = self._expected_seq[order_id]
 
-        pending.sort(key=lambda f: f.sequence_number)
         while pending:
-            next_fill = pending[0]
-            if next_fill.sequence_number == expected:
-                ready.append(pending.pop(0))
+            sequence_number, _, next_fill = pending[0]
+            if sequence_number == expected:
+                heapq.heappop(pending)
+                self._forget_pending(order_id, next_fill)
+                ready.append(next_fill)
                 expected += 1
                 self._expected_seq[order_id] = expected
-            elif next_fill.sequence_number < expected:
-                pending.pop(0)
+            elif sequence_number < expected:
+                heapq.heappop(pending)
+                self._forget_pending(order_id, next_fill)
             else:
-                oldest = min(pending, key=lambda f: f.timestamp)
-                age = (datetime.utcnow() - oldest.timestamp).total_seconds()
+                oldest = self._oldest_pending.get(order_id)
+                if oldest is None:
+                    oldest = min(f.timestamp for _, _, f in pending)
+                    self._oldest_pending[order_id] = oldest
+                age = (datetime.utcnow() - oldest).total_seconds()
                 if age > self.max_wait_seconds:
-                    ready.extend(pending)
+                    ready.extend(f for _, _, f in sorted(pending))
                     pending.clear()
+                    self._oldest_pending.pop(order_id, None)
                 else:
                     break
         return ready
 
+    def _forget_pending(self, order_id: str, fill: "ExecutionReport") -> None:
+        # Only removing the current oldest invalidates the cached bound.
+        if self._oldest_pending.get(order_id) == fill.timestamp:
+            self._oldest_pending[order_id] = None
@@ -6,6 +6,16 @@ from ..application.services.order_state_machine import OrderStateMachine
 from ..domain.models.order import Order, OrderStatus, OrderType, Side
 
 
+_TERMINAL = frozenset(
+    {
+        OrderStatus.FILLED,
+        OrderStatus.CANCELED,
+        OrderStatus.REJECTED,
+        OrderStatus.EXPIRED,
+    }
+)
+
+
 class InvalidOrderTransition(Exception):
     """Raised when OMS transition is invalid."""
 
@@ -17,9 +27,12 @@ class OrderManager:
         self.fsm = fsm
         self.persistence = persistence
         self._orders: Dict[str, Order] = {}
+        # Live view of non-terminal orders, maintained on create/transition.
+        self._open_orders: Dict[str, Order] = {}
 
     def create_order(self, signal: "Signal", account_id: str) -> Order:
         """Create order from approved signal."""
+        now = datetime.utcnow()
         order = Order(
             id=str(uuid.uuid4()),
             symbol=signal.symbol,
@@ -29,11 +42,12 @@ class OrderManager:
             status=OrderStatus.NEW,
             limit_price=None,
             stop_price=None,
-            created_at=datetime.utcnow(),
-            last_update_at=datetime.utcnow(),
+            created_at=now,
+            last_update_at=now,
             account_id=account_id,
         )
         self._orders[order.id] = order
+        self._open_orders[order.id] = order
         self.fsm.add_order(order)
         return order
 
@@ -47,6 +61,8 @@ class OrderManager:
                 f"Cannot transition {current.status if current else 'UNKNOWN'} -> {new_status}"
             )
         order = self.fsm.transition(order_id, new_status)
+        if new_status in _TERMINAL:
+            self._open_orders.pop(order_id, None)
         if venue_order_id:
             order.venue_order_id = venue_order_id
         # Persistence hook (async in real impl)
@@ -56,11 +72,5 @@ class OrderManager:
         return self._orders.get(order_id)
 
     def get_open_orders(self) -> List[Order]:
-        terminal = {
-            OrderStatus.FILLED,
-            OrderStatus.CANCELED,
-            OrderStatus.REJECTED,
-            OrderStatus.EXPIRED,
-        }
-        return [o for o in self._orders.values() if o.status not in terminal]
+        return list(self._open_orders.values())
 
@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class ZombieOrder:
     order: "Order"
     marked_at: datetime
@@ -11,7 +11,7 @@ class ZombieOrder:
     received_fills: List["ExecutionReport"] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class FillHandlingResult:
     action: str
     fill: "ExecutionReport"
@@ -11,7 +11,7 @@ config import.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -94,10 +94,31 @@ PAIR_UNIVERSE: List[str] = [
 
 
 def get_token(symbol: str) -> SolanaToken:
-    key = symbol.upper()
-    if key not in TOKEN_MAP:
-        raise KeyError(f"Token not configured: {symbol}")
-    return TOKEN_MAP[key]
+    # Symbols are almost always already upper-case; only fold on a miss.
+    token = TOKEN_MAP.get(symbol)
+    if token is None:
+        token = TOKEN_MAP.get(symbol.upper())
+        if token is None:
+            raise KeyError(f"Token not configured: {symbol}")
+    return token
+
+
+# "BASE/QUOTE" -> (base, quote); universe pairs resolved at import, others on first use.
+_PAIR_TOKENS: Dict[str, Tuple[SolanaToken, SolanaToken]] = {}
+
+
+def get_pair_tokens(pair: str) -> Tuple[SolanaToken, SolanaToken]:
+    """Resolve both legs of a "BASE/QUOTE" pair, memoized per pair string."""
+    tokens = _PAIR_TOKENS.get(pair)
+    if tokens is None:
+        base_sym, quote_sym = pair.split("/")
+        tokens = _PAIR_TOKENS[pair] = (get_token(base_sym), get_token(quote_sym))
+    return tokens
+
+
+for _pair in PAIR_UNIVERSE:
+    get_pair_tokens(_pair)
+del _pair
 
 
 def list_pairs() -> List[str]:
@@ -117,6 +138,7 @@ __all__ = [
     "TOKEN_MAP",
     "PAIR_UNIVERSE",
     "get_token",
+    "get_pair_tokens",
     "list_pairs",
     "load_extra_tokens",
 ]
@@ -27,6 +27,7 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -38,6 +39,16 @@ from loguru import logger
 # Import our hardened client
 from solana_client import SolanaClient, TxResult, TxOutcome
 
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+# One pooled client is shared by every quote/swap call; keep connections warm
+# between ticks so each request skips the TCP+TLS handshake.
+_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=75)
+
 
 # =============================================================================
 # CONFIGURATION
@@ -89,28 +100,37 @@ class JupiterConfig:
     # SOL reserve for fees
     min_sol_reserve: float = 0.10  # Keep 0.1 SOL for tx fees
     
+    # Per-attempt ladders, capped and resolved once in __post_init__ (attempts past 4 reuse the last rung).
+    _slippage_ladder: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _priority_fee_ladder: Tuple[Optional[int], ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_slippage_ladder", tuple(
+            min(bps, self.slippage_bps_max)
+            for bps in (
+                self.slippage_bps_attempt_1,
+                self.slippage_bps_attempt_2,
+                self.slippage_bps_attempt_3,
+                self.slippage_bps_attempt_4,
+            )
+        ))
+        object.__setattr__(self, "_priority_fee_ladder", tuple(
+            fee if fee > 0 else None  # None means "auto"
+            for fee in (
+                self.priority_fee_attempt_1,
+                self.priority_fee_attempt_2,
+                self.priority_fee_attempt_3,
+                self.priority_fee_attempt_4,
+            )
+        ))
+
     def get_slippage_for_attempt(self, attempt: int) -> int:
         """Get slippage bps for a given attempt number (1-indexed)."""
-        slippages = [
-            self.slippage_bps_attempt_1,
-            self.slippage_bps_attempt_2,
-            self.slippage_bps_attempt_3,
-            self.slippage_bps_attempt_4,
-        ]
-        idx = min(attempt - 1, len(slippages) - 1)
-        return min(slippages[idx], self.slippage_bps_max)
+        return self._slippage_ladder[attempt - 1 if attempt < 4 else 3]
     
     def get_priority_fee_for_attempt(self, attempt: int) -> Optional[int]:
         """Get priority fee for a given attempt number (1-indexed). None = auto."""
-        fees = [
-            self.priority_fee_attempt_1,
-            self.priority_fee_attempt_2,
-            self.priority_fee_attempt_3,
-            self.priority_fee_attempt_4,
-        ]
-        idx = min(attempt - 1, len(fees) - 1)
-        fee = fees[idx]
-        return fee if fee > 0 else None  # None means "auto"
+        return self._priority_fee_ladder[attempt - 1 if attempt < 4 else 3]
 
 
 class PositionState(Enum):
@@ -137,7 +157,20 @@ class PositionState(Enum):
     EXIT_ONLY = "exit_only"
 
 
-@dataclass
+class TradeOutcome(Enum):
+    """
+    Three-state trade outcome; compare members with `is`.
+    
+    - SUCCESS: Confirmed on-chain or reconciled_success
+    - FAILURE: Definitive failure (simulation failed, reconciled_failure)
+    - UNKNOWN: Timeout, RPC ambiguity - tx may still land
+    """
+    SUCCESS = "SUCCESS"
+    FAILURE = "FAILURE"
+    UNKNOWN = "UNKNOWN"
+
+
+@dataclass(slots=True)
 class PairState:
     """
     Per-pair state tracking for idempotency and cooldowns.
@@ -160,9 +193,9 @@ class PairState:
     inflight_sell_signature: Optional[str] = None
     inflight_sell_intent_id: Optional[str] = None
     
-    # Per-side cooldowns (explicit timestamps as per Phase 1)
-    buy_cooldown_until: Optional[datetime] = None
-    sell_cooldown_until: Optional[datetime] = None
+    # Per-side cooldowns (explicit time.monotonic() deadlines as per Phase 1)
+    buy_cooldown_until: Optional[float] = None
+    sell_cooldown_until: Optional[float] = None
     
     # Per-side failure tracking
     buy_consecutive_failures: int = 0
@@ -176,42 +209,49 @@ class PairState:
     last_entry_time: Optional[datetime] = None
     last_exit_time: Optional[datetime] = None
     
-    def is_buy_in_cooldown(self) -> bool:
+    # `now` is a time.monotonic() reading; it lets a caller scanning many
+    # pairs read the clock once per tick. When omitted, the clock is read here.
+
+    def is_buy_in_cooldown(self, now: Optional[float] = None) -> bool:
         """Check if BUY is in failure cooldown."""
-        if self.buy_cooldown_until is None:
+        until = self.buy_cooldown_until
+        if until is None:
             return False
-        return datetime.now(timezone.utc) < self.buy_cooldown_until
+        return (time.monotonic() if now is None else now) < until
     
-    def is_sell_in_cooldown(self) -> bool:
+    def is_sell_in_cooldown(self, now: Optional[float] = None) -> bool:
         """Check if SELL is in failure cooldown."""
-        if self.sell_cooldown_until is None:
+        until = self.sell_cooldown_until
+        if until is None:
             return False
-        return datetime.now(timezone.utc) < self.sell_cooldown_until
+        return (time.monotonic() if now is None else now) < until
     
-    def record_buy_failure(self, cooldown_threshold: int, cooldown_seconds: float) -> None:
+    def record_buy_failure(
+        self, cooldown_threshold: int, cooldown_seconds: float, now: Optional[float] = None
+    ) -> None:
         """Record a BUY failure and potentially trigger cooldown."""
         self.buy_consecutive_failures += 1
         
         if self.buy_consecutive_failures >= cooldown_threshold:
-            self.buy_cooldown_until = datetime.now(timezone.utc) + \
-                                      __import__('datetime').timedelta(seconds=cooldown_seconds)
+            self.buy_cooldown_until = (time.monotonic() if now is None else now) + cooldown_seconds
             self.current_buy_attempt = 0  # Reset attempt counter
             logger.warning(
                 f"BUY_COOLDOWN_START | {self.pair} | failures={self.buy_consecutive_failures} | "
-                f"until={self.buy_cooldown_until.isoformat()}"
+                f"for={cooldown_seconds:.1f}s"
             )
     
-    def record_sell_failure(self, cooldown_threshold: int, cooldown_seconds: float) -> None:
+    def record_sell_failure(
+        self, cooldown_threshold: int, cooldown_seconds: float, now: Optional[float] = None
+    ) -> None:
         """Record a SELL failure and potentially trigger cooldown."""
         self.sell_consecutive_failures += 1
         
         if self.sell_consecutive_failures >= cooldown_threshold:
-            self.sell_cooldown_until = datetime.now(timezone.utc) + \
-                                       __import__('datetime').timedelta(seconds=cooldown_seconds)
+            self.sell_cooldown_until = (time.monotonic() if now is None else now) + cooldown_seconds
             self.current_sell_attempt = 0  # Reset attempt counter
             logger.warning(
                 f"SELL_COOLDOWN_START | {self.pair} | failures={self.sell_consecutive_failures} | "
-                f"until={self.sell_cooldown_until.isoformat()}"
+                f"for={cooldown_seconds:.1f}s"
             )
     
     def reset_buy_failures(self) -> None:
@@ -239,23 +279,20 @@ class PairState:
         """
         Phase 3: Check if there's an inflight exit for this token.
         
-        This prevents double-selling when first tx lands late.
+        This prevents double-selling when first tx lands late. Inflight
+        status lives in the signature, not in position_state.
         """
-        return self.inflight_sell_signature is not None or \
-               self.position_state == PositionState.EXITING_INFLIGHT
+        return self.inflight_sell_signature is not None
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeResult:
     """
     Result of a trade execution.
     
-    CRITICAL: outcome is a 3-state enum, NOT binary success.
-    - SUCCESS: Confirmed on-chain or reconciled_success
-    - FAILURE: Definitive failure (simulation failed, reconciled_failure)
-    - UNKNOWN: Timeout, RPC ambiguity - tx may still land
+    CRITICAL: outcome is a 3-state enum (TradeOutcome), NOT binary success.
     """
-    outcome: str  # "SUCCESS", "FAILURE", "UNKNOWN"
+    outcome: TradeOutcome
     pair: str
     side: str  # "BUY" or "SELL"
     signature: Optional[str] = None
@@ -277,12 +314,12 @@ class TradeResult:
     @property
     def success(self) -> bool:
         """Backward compat - but prefer checking outcome directly."""
-        return self.outcome == "SUCCESS"
+        return self.outcome is TradeOutcome.SUCCESS
     
     @property
     def is_unknown(self) -> bool:
         """True if outcome is uncertain - tx may still land."""
-        return self.outcome == "UNKNOWN"
+        return self.outcome is TradeOutcome.UNKNOWN
 
 
 # =============================================================================
@@ -313,15 +350,22 @@ TOKENS: Dict[str, TokenInfo] = {
 
 def get_token(symbol: str) -> TokenInfo:
     """Get token info by symbol."""
-    if symbol not in TOKENS:
+    token = TOKENS.get(symbol)
+    if token is None:
         raise ValueError(f"Unknown token: {symbol}")
-    return TOKENS[symbol]
+    return token
+
+
+_PAIR_TOKENS: Dict[str, Tuple[TokenInfo, TokenInfo]] = {}
 
 
 def parse_pair(pair: str) -> Tuple[TokenInfo, TokenInfo]:
-    """Parse pair string into base and quote tokens."""
-    base_sym, quote_sym = pair.split("/")
-    return get_token(base_sym), get_token(quote_sym)
+    """Parse pair string into base and quote tokens, memoized per pair string."""
+    tokens = _PAIR_TOKENS.get(pair)
+    if tokens is None:
+        base_sym, quote_sym = pair.split("/")
+        tokens = _PAIR_TOKENS[pair] = (get_token(base_sym), get_token(quote_sym))
+    return tokens
 
 
 # =============================================================================
@@ -355,18 +399,22 @@ class JupiterAdapter:
         logger.info(f"JUPITER_ADAPTER | init | slippage={config.slippage_bps}bps")
     
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client with IPv4 transport."""
+        """Get or create the shared pooled HTTP client (IPv4, HTTP/2 when h2 is installed)."""
         if self._client is None or self._client.is_closed:
             # Try to use IPv4 transport if network_bootstrap is available
             try:
                 from network_bootstrap import create_ipv4_transport
-                transport = create_ipv4_transport()
+                transport = create_ipv4_transport(limits=_HTTP_LIMITS, http2=_HTTP2)
                 self._client = httpx.AsyncClient(
                     timeout=self.config.http_timeout,
                     transport=transport,
                 )
             except ImportError:
-                self._client = httpx.AsyncClient(timeout=self.config.http_timeout)
+                self._client = httpx.AsyncClient(
+                    timeout=self.config.http_timeout,
+                    limits=_HTTP_LIMITS,
+                    http2=_HTTP2,
+                )
         return self._client
     
     async def close(self):
@@ -384,12 +432,15 @@ class JupiterAdapter:
     # GATING CHECKS (from ChatGPT analysis)
     # =========================================================================
     
-    def can_enter(self, pair: str) -> Tuple[bool, Optional[str]]:
+    def can_enter(self, pair: str, now: Optional[float] = None) -> Tuple[bool, Optional[str]]:
         """
         Check if entry is allowed for a pair.
         
         CRITICAL: Single-flight protection.
         If inflight_buy_signature is set (from UNKNOWN outcome), block new entry.
+        
+        Pass `now` (a time.monotonic() reading) when checking many pairs in one
+        scan so the clock is read once.
         """
         state = self._get_pair_state(pair)
         
@@ -398,10 +449,10 @@ class JupiterAdapter:
             return False, "exit_only_mode"
         
         # Can't enter if position exists
-        if state.position_state == PositionState.OPEN:
+        if state.position_state is PositionState.OPEN:
             return False, "position_open"
         
-        if state.position_state == PositionState.EXIT_ONLY:
+        if state.position_state is PositionState.EXIT_ONLY:
             return False, "pair_exit_only"
         
         # CRITICAL: If there's an inflight buy signature, block
@@ -410,36 +461,40 @@ class JupiterAdapter:
             return False, f"inflight_buy:{state.inflight_buy_signature[:16] if len(state.inflight_buy_signature or '') > 16 else state.inflight_buy_signature}..."
         
         # Check BUY cooldown
-        if state.is_buy_in_cooldown():
-            return False, f"buy_cooldown_until:{state.buy_cooldown_until.isoformat()}"
+        if now is None:
+            now = time.monotonic()
+        if state.is_buy_in_cooldown(now):
+            return False, f"buy_cooldown_remaining:{state.buy_cooldown_until - now:.1f}s"
         
         return True, None
     
-    def can_exit(self, pair: str) -> Tuple[bool, Optional[str]]:
+    def can_exit(self, pair: str, now: Optional[float] = None) -> Tuple[bool, Optional[str]]:
         """
         Check if exit is allowed for a pair.
         
         CRITICAL: Single-flight protection for exits.
         If inflight_sell_signature is set (from UNKNOWN outcome), block new exit.
         This prevents double-selling when first tx may still land.
+        
+        Pass `now` (a time.monotonic() reading) when checking many pairs in one
+        scan so the clock is read once.
         """
         state = self._get_pair_state(pair)
         
         # Can't exit if no position
-        if state.position_state == PositionState.FLAT:
+        if state.position_state is PositionState.FLAT:
             return False, "no_position"
         
-        if state.position_state == PositionState.ENTERING_INFLIGHT:
-            return False, "still_entering"
-        
         # CRITICAL: If there's an inflight sell signature, block
         # This is set when outcome=UNKNOWN and preserved until resolved
         if state.inflight_sell_signature is not None:
             return False, f"inflight_sell:{state.inflight_sell_signature[:16] if len(state.inflight_sell_signature or '') > 16 else state.inflight_sell_signature}..."
         
         # Check SELL cooldown
-        if state.is_sell_in_cooldown():
-            return False, f"sell_cooldown_until:{state.sell_cooldown_until.isoformat()}"
+        if now is None:
+            now = time.monotonic()
+        if state.is_sell_in_cooldown(now):
+            return False, f"sell_cooldown_remaining:{state.sell_cooldown_until - now:.1f}s"
         
         return True, None
     
@@ -635,7 +690,7 @@ class JupiterAdapter:
                     f"LADDER_PRICE_IMPACT | {pair} | {side} | impact={price_impact:.0f}bps"
                 )
                 return TradeResult(
-                    outcome="FAILURE",
+                    outcome=TradeOutcome.FAILURE,
                     pair=pair,
                     side=side,
                     error=f"price_impact:{price_impact:.0f}bps",
@@ -685,7 +740,7 @@ class JupiterAdapter:
                 # SUCCESS - confirmed or reconciled_success
                 logger.info(f"LADDER_SUCCESS | {pair} | {side} | attempt={attempt}")
                 return TradeResult(
-                    outcome="SUCCESS",
+                    outcome=TradeOutcome.SUCCESS,
                     pair=pair,
                     side=side,
                     signature=tx_result.signature,
@@ -701,7 +756,7 @@ class JupiterAdapter:
                 # Reconciliation shows tx landed - treat as SUCCESS
                 logger.warning(f"LADDER_LANDED_UNCONFIRMED | {pair} | {side} | treating as SUCCESS")
                 return TradeResult(
-                    outcome="SUCCESS",
+                    outcome=TradeOutcome.SUCCESS,
                     pair=pair,
                     side=side,
                     signature=tx_result.signature,
@@ -732,7 +787,7 @@ class JupiterAdapter:
                     f"outcome={tx_result.outcome.value} | PRESERVING INFLIGHT"
                 )
                 return TradeResult(
-                    outcome="UNKNOWN",
+                    outcome=TradeOutcome.UNKNOWN,
                     pair=pair,
                     side=side,
                     signature=tx_result.signature,
@@ -757,7 +812,7 @@ class JupiterAdapter:
             state.inflight_sell_signature = None
         
         return TradeResult(
-            outcome="FAILURE",
+            outcome=TradeOutcome.FAILURE,
             pair=pair,
             side=side,
             error="all_attempts_exhausted",
@@ -792,7 +847,7 @@ class JupiterAdapter:
         if not can:
             logger.info(f"ENTRY_BLOCKED | {pair} | {reason}")
             return TradeResult(
-                outcome="FAILURE",
+                outcome=TradeOutcome.FAILURE,
                 pair=pair,
                 side="BUY",
                 error=reason,
@@ -818,7 +873,7 @@ class JupiterAdapter:
         )
         
         # State transitions ONLY here, based on outcome
-        if result.outcome == "SUCCESS":
+        if result.outcome is TradeOutcome.SUCCESS:
             # Confirmed or reconciled_success -> advance to OPEN
             state.position_state = PositionState.OPEN
             state.entry_price = price
@@ -835,12 +890,12 @@ class JupiterAdapter:
             
             logger.info(f"STATE_TRANSITION | {pair} | FLAT -> OPEN | ENTRY_SUCCESS")
             
-        elif result.outcome == "FAILURE":
+        elif result.outcome is TradeOutcome.FAILURE:
             # Definitive failure -> stays FLAT
             # inflight already cleared in execute_with_ladder
             logger.info(f"STATE_NO_CHANGE | {pair} | stays FLAT | ENTRY_FAILURE")
             
-        elif result.outcome == "UNKNOWN":
+        elif result.outcome is TradeOutcome.UNKNOWN:
             # UNKNOWN -> NO state change, inflight preserved
             # The tx may still land - cannot assume FLAT or OPEN
             logger.warning(
@@ -874,7 +929,7 @@ class JupiterAdapter:
         if not can:
             logger.info(f"EXIT_BLOCKED | {pair} | {gate_reason}")
             return TradeResult(
-                outcome="FAILURE",
+                outcome=TradeOutcome.FAILURE,
                 pair=pair,
                 side="SELL",
                 error=gate_reason,
@@ -904,7 +959,7 @@ class JupiterAdapter:
         )
         
         # State transitions ONLY here, based on outcome
-        if result.outcome == "SUCCESS":
+        if result.outcome is TradeOutcome.SUCCESS:
             # Confirmed or reconciled_success -> position closed
             state.position_state = PositionState.FLAT
             state.entry_price = None
@@ -924,7 +979,7 @@ class JupiterAdapter:
                 f"pnl={pnl_pct:.2f}% | reason={reason}"
             )
             
-        elif result.outcome == "FAILURE":
+        elif result.outcome is TradeOutcome.FAILURE:
             # Definitive failure -> still have position
             # inflight already cleared in execute_with_ladder
             if state.sell_consecutive_failures >= self.config.failure_threshold:
@@ -933,7 +988,7 @@ class JupiterAdapter:
             else:
                 logger.info(f"STATE_NO_CHANGE | {pair} | stays OPEN | EXIT_FAILURE")
             
-        elif result.outcome == "UNKNOWN":
+        elif result.outcome is TradeOutcome.UNKNOWN:
             # UNKNOWN -> NO state change, inflight PRESERVED
             # The sell tx may still land - CANNOT fire another sell
             # This is the critical single-flight protection
@@ -1111,7 +1166,7 @@ class JupiterAdapter:
                         result = await self.exit(pair, price, reason="shutdown_sol")
                         results.append(result)
         
-        success_count = sum(1 for r in results if r.outcome == "SUCCESS")
+        success_count = sum(1 for r in results if r.outcome is TradeOutcome.SUCCESS)
         logger.warning(f"FLATTEN_ALL | COMPLETE | {success_count}/{len(results)} succeeded")
         
         return results
@@ -1190,6 +1245,11 @@ class JupiterAdapter:
                 positions.append(pos)
         return positions
     
+    def enterable_pairs(self, pairs: List[str]) -> List[str]:
+        """Pairs that currently pass can_enter, gated against one clock read."""
+        now = time.monotonic()
+        return [pair for pair in pairs if self.can_enter(pair, now)[0]]
+    
     def is_exit_only_mode(self) -> bool:
         """Check if adapter is in global exit-only mode."""
         return self._exit_only_mode
@@ -291,10 +291,13 @@ def is_bootstrap_applied() -> bool:
 # HTTPX TRANSPORT FACTORY
 # =============================================================================
 
-def create_ipv4_transport():
+def create_ipv4_transport(**transport_kwargs):
     """
     Create an httpx transport that forces IPv4.
     
+    Extra keyword arguments (e.g. limits, http2) are passed to
+    httpx.AsyncHTTPTransport.
+    
     Usage:
         import httpx
         from network_bootstrap import create_ipv4_transport
@@ -304,7 +307,7 @@ def create_ipv4_transport():
     """
     try:
         import httpx
-        return httpx.AsyncHTTPTransport(local_address="0.0.0.0")
+        return httpx.AsyncHTTPTransport(local_address="0.0.0.0", **transport_kwargs)
     except ImportError:
         _log("WARN", "httpx not available - cannot create IPv4 transport")
         return None
@@ -1063,14 +1063,12 @@ class JupiterDexEngine:
         Returns:
             True if all prices are valid within TTL, False otherwise
         """
-        from otq.config.solana_tokens import get_token
+        from otq.config.solana_tokens import get_pair_tokens
         
         all_valid = True
         
         for pair in self.cfg.pairs:
-            base_sym, quote_sym = pair.split("/")
-            base_token = get_token(base_sym)
-            quote_token = get_token(quote_sym)
+            base_token, quote_token = get_pair_tokens(pair)
             
             price_point, why_not = await self.price_oracle.get_price(
                 pair=pair,
@@ -1299,10 +1297,8 @@ class JupiterDexEngine:
         self._pair_states[pair].inflight = True
         
         try:
-            base_sym, quote_sym = pair.split("/")
-            from otq.config.solana_tokens import get_token
-            base_token = get_token(base_sym)
-            quote_token = get_token(quote_sym)
+            from otq.config.solana_tokens import get_pair_tokens
+            base_token, quote_token = get_pair_tokens(pair)
             
             notional = self.strategy.config.notional_per_trade
             size_base = notional / price_point.price
@@ -1397,10 +1393,8 @@ class JupiterDexEngine:
         self._pair_states[pair].inflight = True
         
         try:
-            base_sym, quote_sym = pair.split("/")
-            from otq.config.solana_tokens import get_token
-            base_token = get_token(base_sym)
-            quote_token = get_token(quote_sym)
+            from otq.config.solana_tokens import get_pair_tokens
+            base_token, quote_token = get_pair_tokens(pair)
             
             pnl_pct = ((price_point.price - position.entry_price) / position.entry_price) * 100
             amount_in = int(position.size_base * (10 ** base_token.decimals))
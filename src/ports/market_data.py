@@ -5,7 +5,7 @@ from datetime import datetime
 from decimal import Decimal
 
 
-@dataclass
+@dataclass(slots=True)
 class Tick:
     """Raw market data tick."""
 
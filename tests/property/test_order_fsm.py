@@ -1,8 +1,9 @@
 from hypothesis import given, strategies as st
 
 from src.application.services.order_state_machine import OrderStateMachine, InvalidTransition
+from src.domain.models.clock import Clock, SessionType
 from src.domain.models.order import Order, OrderStatus, OrderType, Side
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 import uuid
 
@@ -44,3 +45,13 @@ def test_order_fsm_transitions(current, target):
         else:
             assert False, f"Transition {current}->{target} should be invalid"
 
+
+def test_transition_uses_explicit_or_clock_time():
+    sim_now = datetime(2024, 1, 2, 14, 30)
+    fsm = OrderStateMachine(clock=Clock(now=sim_now, session=SessionType.REGULAR, bar_index=0, trading_day=date(2024, 1, 2)))
+    order = make_order(OrderStatus.NEW)
+    fsm.add_order(order)
+
+    assert fsm.transition(order.id, OrderStatus.PENDING).last_update_at == sim_now
+    stamp = datetime(2024, 1, 2, 14, 31)
+    assert fsm.transition(order.id, OrderStatus.SUBMITTED, now=stamp).last_update_at == stamp
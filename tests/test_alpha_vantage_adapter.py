@@ -0,0 +1,50 @@
+from datetime import datetime
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from src.adapters.market_data.alpha_vantage_adapter import AlphaVantageAdapter
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def make_series(n: int) -> dict:
+    series = {}
+    for i in range(n):
+        series[f"2024-01-05 09:{30 + i:02d}:00"] = {
+            "1. open": str(100 + i),
+            "2. high": str(101 + i),
+            "3. low": str(99 + i),
+            "4. close": f"{100 + i}.5",
+            "5. volume": "10",
+        }
+    return {"Time Series (1min)": series}
+
+
+@pytest.mark.anyio
+async def test_get_ohlcv_returns_newest_bars_in_ascending_order():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.params["function"])
+        return httpx.Response(200, json=make_series(10))
+
+    adapter = AlphaVantageAdapter("key", session=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    bars = await adapter.get_ohlcv("spy", "1m", limit=3)
+
+    assert [b["ts"] for b in bars] == [
+        datetime(2024, 1, 5, 9, 37),
+        datetime(2024, 1, 5, 9, 38),
+        datetime(2024, 1, 5, 9, 39),
+    ]
+    assert bars[-1]["close"] == Decimal("109.5")
+
+    # A one-bar request must not truncate a later, larger request.
+    tick = await adapter.get_tick("spy")
+    assert tick.price == Decimal("109.5")
+    assert len(await adapter.get_ohlcv("spy", "1m", limit=3)) == 3
+    assert len(calls) == 2
@@ -0,0 +1,77 @@
+from decimal import Decimal
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from cachetools import TTLCache
+
+from src.adapters.market_data import coingecko_adapter
+from src.adapters.market_data.coingecko_adapter import CoinGeckoMarketDataAdapter, _TokenBucket
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def make_adapter(handler) -> CoinGeckoMarketDataAdapter:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    adapter = CoinGeckoMarketDataAdapter(session=client)
+    adapter._bucket = _TokenBucket(rate=1000.0, burst=100)
+    return adapter
+
+
+@pytest.mark.anyio
+async def test_token_bucket_spaces_requests_after_burst(monkeypatch):
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    # Freeze the bucket's clock and record the waits it asks for.
+    monkeypatch.setattr(coingecko_adapter, "time", SimpleNamespace(monotonic=lambda: 100.0))
+    monkeypatch.setattr(coingecko_adapter, "asyncio", SimpleNamespace(sleep=fake_sleep))
+    bucket = _TokenBucket(rate=20.0, burst=2)
+    for _ in range(4):
+        await bucket.acquire()
+    # Two tokens are banked; the other two wait for 50ms refills.
+    assert sleeps == pytest.approx([0.05, 0.10])
+
+
+@pytest.mark.anyio
+async def test_perp_metrics_share_one_derivatives_fetch():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(
+            200,
+            json=[
+                {"base": "SOL", "funding_rate": 0.01, "open_interest_usd": 5},
+                {"base": "BTC", "funding_rate": 0.02},
+                {"base": "SOL", "funding_rate": 9},
+            ],
+        )
+
+    adapter = make_adapter(handler)
+    sol = await adapter.get_perp_metrics("sol")
+    btc = await adapter.get_perp_metrics("BTC")
+    eth = await adapter.get_perp_metrics("ETH")
+
+    assert sol.funding_rate == Decimal("0.01")  # first listing wins
+    assert btc.funding_rate == Decimal("0.02")
+    assert eth is None
+    assert calls == ["/api/v3/derivatives"]
+
+
+@pytest.mark.anyio
+async def test_price_cache_is_bounded():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"solana": {"usd": 150.25}, "bitcoin": {"usd": 1}})
+
+    adapter = make_adapter(handler)
+    adapter._price_cache = TTLCache(maxsize=1, ttl=60)
+    first = await adapter.get_tick("SOL")
+    assert await adapter.get_tick("SOL") is first
+    await adapter.get_tick("BTC")
+    assert list(adapter._price_cache) == ["BTC"]
@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from src.application.event_bus import EventBus
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class Ping:
+    def __init__(self, key: str, n: int):
+        self.key = key
+        self.n = n
+
+
+def make_recorder(bus: EventBus, expected: int):
+    """Subscribe a handler that records (key, n) and sets `done` after `expected` events."""
+    seen = []
+    done = asyncio.Event()
+
+    async def handler(event: Ping):
+        await asyncio.sleep(0)
+        seen.append((event.key, event.n))
+        if len(seen) == expected:
+            done.set()
+
+    bus.subscribe(Ping, handler)
+    return seen, done
+
+
+@pytest.mark.anyio
+async def test_ordered_publish_keeps_per_key_fifo_with_one_worker():
+    bus = EventBus()
+    seen, done = make_recorder(bus, expected=6)
+
+    await bus.publish(Ping("SOL", 0), sequence_key="SOL")
+    worker = bus._ordered_task
+    await bus.publish(Ping("BTC", 0), sequence_key="BTC")
+    for n in (1, 2):
+        for key in ("SOL", "BTC"):
+            await bus.publish(Ping(key, n), sequence_key=key)
+    await asyncio.wait_for(done.wait(), timeout=1.0)
+
+    assert bus._ordered_task is worker and not worker.done()
+    assert [n for k, n in seen if k == "SOL"] == [0, 1, 2]
+    assert [n for k, n in seen if k == "BTC"] == [0, 1, 2]
+    assert bus._ordered == {}
+    await bus.stop()
+
+
+@pytest.mark.anyio
+async def test_dispatch_continues_after_failing_handler():
+    bus = EventBus()
+    seen = []
+
+    async def boom(event: Ping):
+        raise RuntimeError("boom")
+
+    async def record(event: Ping):
+        seen.append(event.n)
+
+    bus.subscribe(Ping, record)
+    bus.subscribe(Ping, boom)
+    bus.subscribe(Ping, record)
+    await bus._dispatch(Ping("SOL", 7))
+    assert seen == [7, 7]
+
+
+@pytest.mark.anyio
+async def test_ordered_worker_restarts_after_it_dies():
+    bus = EventBus()
+    seen, done = make_recorder(bus, expected=1)
+
+    await bus.publish(Ping("SOL", 0), sequence_key="SOL")
+    await asyncio.wait_for(done.wait(), timeout=1.0)
+    dead = bus._ordered_task
+    dead.cancel()
+    await asyncio.gather(dead, return_exceptions=True)
+
+    seen.clear()
+    done.clear()
+    await bus.publish(Ping("SOL", 1), sequence_key="SOL")
+    await asyncio.wait_for(done.wait(), timeout=1.0)
+
+    assert seen == [("SOL", 1)]
+    assert bus._ordered_task is not dead and not bus._ordered_task.done()
+    await bus.stop()
@@ -0,0 +1,59 @@
+from datetime import datetime
+from decimal import Decimal
+
+from src.domain.models.execution_report import ExecutionReport
+from src.domain.models.order import OrderStatus
+from src.oms.fill_processor import FillSequencer
+
+
+def make_fill(seq: int, fill_id: str = None, qty: str = "1", order_id: str = "o1", now: datetime = None) -> ExecutionReport:
+    now = now or datetime.utcnow()
+    return ExecutionReport(
+        order_id=order_id,
+        venue_order_id="v1",
+        venue_fill_id=fill_id or f"f{seq}",
+        timestamp=now,
+        status=OrderStatus.PARTIALLY_FILLED,
+        filled_qty=Decimal(qty),
+        remaining_qty=Decimal("0"),
+        avg_fill_price=Decimal("100"),
+        fee=None,
+        fee_currency=None,
+        venue_id="test",
+        sequence_number=seq,
+        is_final=False,
+        raw_message={},
+        venue_timestamp=now,
+    )
+
+
+def test_duplicate_fill_is_dropped():
+    sequencer = FillSequencer()
+    fill = make_fill(1)
+    assert sequencer.receive_fill(fill) == [fill]
+    assert sequencer.receive_fill(fill) == []
+
+
+def test_out_of_order_fills_are_released_in_sequence():
+    sequencer = FillSequencer()
+    third, second, first = make_fill(3), make_fill(2), make_fill(1)
+    assert sequencer.receive_fill(third) == []
+    assert sequencer.receive_fill(second) == []
+    assert sequencer.receive_fill(first) == [first, second, third]
+
+
+def test_gap_is_flushed_after_max_wait():
+    from datetime import timedelta
+
+    sequencer = FillSequencer(max_wait_seconds=5.0)
+    stale = make_fill(3, now=datetime.utcnow() - timedelta(seconds=10))
+    fresh = make_fill(2)
+    assert sequencer.receive_fill(fresh) == []
+    assert sequencer.receive_fill(stale) == [fresh, stale]
+
+
+def test_seen_fill_keys_are_bounded():
+    sequencer = FillSequencer(max_seen_fills=2)
+    for seq in (1, 2, 3):
+        sequencer.receive_fill(make_fill(seq))
+    assert len(sequencer._seen_keys) == 2
@@ -82,3 +82,87 @@ async def test_tick_cache_respects_ttl():
     assert primary.calls == 1  # cached second call
     assert fallback.calls == 0
 
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_build_enriched_tick_fetches_spot_and_perp_once():
+    from src.domain.models.perp_metrics import PerpMetrics
+
+    class PerpAdapter(FakeAdapter):
+        perp_calls = 0
+
+        async def get_perp_metrics(self, symbol: str):
+            self.perp_calls += 1
+            return PerpMetrics(
+                symbol=symbol,
+                funding_rate=Decimal("0.001"),
+                open_interest=Decimal("5"),
+                volume_24h=Decimal("7"),
+                timestamp=datetime.utcnow(),
+            )
+
+    adapter = PerpAdapter(make_tick("100"))
+    svc = HybridMarketDataService(adapter)
+    enriched = await svc.build_enriched_tick("SOLUSD")
+    assert enriched["perp_proxy_price"] == Decimal("102.4")
+    assert enriched["perp_funding"] == Decimal("0.001")
+    assert adapter.calls == 1
+    assert adapter.perp_calls == 1
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_get_ticks_bounds_in_flight_requests():
+    class SlowAdapter(FakeAdapter):
+        in_flight = 0
+        peak = 0
+
+        async def get_tick(self, symbol: str) -> Tick:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            return make_tick(symbol=symbol)
+
+    adapter = SlowAdapter(make_tick())
+    svc = HybridMarketDataService(adapter, max_concurrency=2)
+    ticks = await svc.get_ticks([f"S{i}" for i in range(6)])
+    assert [t.symbol for t in ticks] == [f"S{i}" for i in range(6)]
+    assert adapter.peak == 2
+
+
+@pytest.mark.anyio
+async def test_tick_cache_is_bounded():
+    from cachetools import TTLCache
+
+    adapter = FakeAdapter(make_tick())
+    svc = HybridMarketDataService(adapter, cache_ttl_seconds=60)
+    svc._tick_cache = TTLCache(maxsize=2, ttl=60)
+    for symbol in ("A", "B", "C", "A"):
+        await svc.get_tick(symbol)
+    assert len(svc._tick_cache) == 2
+    assert adapter.calls == 4  # "A" was evicted before it was asked for again
+
+
+@pytest.mark.anyio
+async def test_zero_ttl_forwards_every_call_to_adapter():
+    adapter = FakeAdapter(make_tick())
+    svc = HybridMarketDataService(adapter)
+    await svc.get_tick("SOLUSD")
+    await svc.get_tick("SOLUSD")
+    assert svc._tick_cache is None
+    assert adapter.calls == 2
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+async def test_get_ohlcv_many_preserves_spec_order():
+    class BarsAdapter(FakeAdapter):
+        async def get_ohlcv(self, symbol: str, timeframe: str, limit: int = 200):
+            await asyncio.sleep(0.01 if symbol == "SOL" else 0)
+            return [{"symbol": symbol, "timeframe": timeframe, "limit": limit}]
+
+    svc = HybridMarketDataService(BarsAdapter(make_tick()), max_concurrency=2)
+    specs = [("SOL", "1h", 10), ("BTC", "1m", 5), ("ETH", "1d", 1)]
+    results = await svc.get_ohlcv_many(specs)
+    assert [(r[0]["symbol"], r[0]["timeframe"], r[0]["limit"]) for r in results] == specs
@@ -0,0 +1,50 @@
+from datetime import datetime
+from decimal import Decimal
+
+from src.application.services.order_state_machine import OrderStateMachine
+from src.domain.events.signal import Signal
+from src.domain.models.order import OrderStatus
+from src.oms.order_manager import _TERMINAL, OrderManager
+
+
+def make_signal(target: str = "10") -> Signal:
+    return Signal(
+        strategy_id="trend",
+        symbol="SPY",
+        target_position=Decimal(target),
+        confidence=0.9,
+        timestamp=datetime.utcnow(),
+        metadata={},
+    )
+
+
+def scanned_open_ids(oms: OrderManager) -> set:
+    return {o.id for o in oms._orders.values() if o.status not in _TERMINAL}
+
+
+def test_open_orders_index_matches_full_scan():
+    oms = OrderManager(OrderStateMachine())
+    filled, partial, canceled, rejected = (oms.create_order(make_signal(), "live") for _ in range(4))
+
+    def assert_index_matches():
+        assert {o.id for o in oms.get_open_orders()} == scanned_open_ids(oms)
+
+    assert_index_matches()
+    for order in (filled, partial):
+        oms.transition_order(order.id, OrderStatus.PENDING)
+        oms.transition_order(order.id, OrderStatus.SUBMITTED)
+        assert_index_matches()
+
+    oms.transition_order(filled.id, OrderStatus.FILLED)
+    assert_index_matches()
+    oms.transition_order(partial.id, OrderStatus.PARTIALLY_FILLED)
+    assert_index_matches()
+    oms.transition_order(canceled.id, OrderStatus.CANCELED)
+    assert_index_matches()
+    oms.transition_order(rejected.id, OrderStatus.REJECTED)
+    assert_index_matches()
+    assert [o.id for o in oms.get_open_orders()] == [partial.id]
+
+    oms.transition_order(partial.id, OrderStatus.FILLED)
+    assert_index_matches()
+    assert oms.get_open_orders() == []
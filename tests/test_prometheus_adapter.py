@@ -0,0 +1,44 @@
+import io
+
+from src.adapters.telemetry.prometheus import PrometheusAdapter
+
+
+def test_records_are_buffered_and_written_in_order_on_stop():
+    out = io.StringIO()
+    telemetry = PrometheusAdapter(stream=out)
+    telemetry.record_metric("fills", 3, {"symbol": "SOL"})
+    telemetry.record_latency("quote", 1.234)
+    telemetry.log_structured("info", "ready", {"venue": "jupiter"})
+    telemetry.stop()
+
+    assert out.getvalue().splitlines() == [
+        "[metric] fills=3 tags={'symbol': 'SOL'}",
+        "[latency] quote 1.23ms",
+        "[info] ready | {'venue': 'jupiter'}",
+    ]
+
+
+def test_tags_are_copied_and_exit_hook_released_on_stop(monkeypatch):
+    hooks = []
+    monkeypatch.setattr("atexit.register", hooks.append)
+    monkeypatch.setattr("atexit.unregister", hooks.remove)
+    out = io.StringIO()
+    telemetry = PrometheusAdapter(stream=out)
+    for _ in range(3):
+        tags = {"symbol": "SOL"}
+        telemetry.record_metric("fills", 1, tags)
+        tags["symbol"] = "BTC"
+        telemetry.stop()
+
+    assert hooks == []
+    assert out.getvalue().splitlines() == ["[metric] fills=1 tags={'symbol': 'SOL'}"] * 3
+
+
+def test_missing_tags_and_context_are_accepted():
+    out = io.StringIO()
+    telemetry = PrometheusAdapter(stream=out)
+    telemetry.record_metric("fills", 1, None)
+    telemetry.log_structured("info", "ready", None)
+    telemetry.stop()
+
+    assert out.getvalue().splitlines() == ["[metric] fills=1 tags={}", "[info] ready | {}"]
@@ -0,0 +1,65 @@
+from datetime import datetime
+from decimal import Decimal
+
+import numpy as np
+
+from src.domain.fill_models.slippage import AlmgrenChrissSlippage, SlippageConfig
+from src.domain.models.market_state import MarketState
+from src.domain.models.order import Order, OrderStatus, OrderType, Side
+
+
+def make_state(mid: str, spread: str, vol: str) -> MarketState:
+    half = Decimal(spread) / 2
+    return MarketState(
+        symbol="SOL",
+        timestamp=datetime.utcnow(),
+        mid=Decimal(mid),
+        bid=Decimal(mid) - half,
+        ask=Decimal(mid) + half,
+        spread=Decimal(spread),
+        vol_estimate=Decimal(vol),
+        liquidity_score=Decimal("0"),
+        features={},
+        regime_indicators={},
+    )
+
+
+def make_order(qty: str, order_type: OrderType) -> Order:
+    now = datetime.utcnow()
+    return Order(
+        id="o1",
+        symbol="SOL",
+        side=Side.BUY,
+        qty=Decimal(qty),
+        order_type=order_type,
+        status=OrderStatus.NEW,
+        limit_price=None,
+        stop_price=None,
+        created_at=now,
+        last_update_at=now,
+        account_id="live",
+    )
+
+
+def test_batch_matches_scalar_estimates():
+    model = AlmgrenChrissSlippage()
+    config = SlippageConfig()
+    cases = [
+        ("10", OrderType.MARKET, "100", "0.1", "0.3"),
+        ("2500", OrderType.LIMIT, "42.5", "0.02", "0"),
+        ("1", OrderType.MARKET, "0.5", "0.001", "1.2"),
+    ]
+    scalar = [
+        model.estimate_slippage(make_order(q, t), make_state(m, s, v), config)
+        for q, t, m, s, v in cases
+    ]
+    batch = model.estimate_slippage_batch(
+        order_size=np.array([float(c[0]) for c in cases]),
+        mid=np.array([float(c[2]) for c in cases]),
+        spread=np.array([float(c[3]) for c in cases]),
+        vol=np.array([float(c[4]) for c in cases]),
+        adv=np.full(len(cases), 1_000_000.0),
+        is_market=np.array([c[1] == OrderType.MARKET for c in cases]),
+        config=config,
+    )
+    assert [Decimal(x).quantize(Decimal("0.000001")) for x in batch] == scalar
@@ -11,3 +11,10 @@ def test_solana_token_mints_are_correct_for_jupiter_universe() -> None:
 
 def test_get_token_is_case_insensitive() -> None:
     assert get_token("jup").mint == get_token("JUP").mint
+
+
+def test_get_pair_tokens_resolves_both_legs() -> None:
+    from otq.config.solana_tokens import SOL, USDC, get_pair_tokens
+
+    assert get_pair_tokens("SOL/USDC") == (SOL, USDC)
+    assert get_pair_tokens("bonk/usdc")[0].symbol == "BONK"